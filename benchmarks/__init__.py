@@ -0,0 +1,31 @@
+from asyncpg import Connection, connect
+from redis.asyncio import Redis
+
+
+async def reset_database(database_url: str, drop_stats_shards: bool = False) -> None:
+    connection: Connection = await connect(dsn=database_url)
+    try:
+        await connection.execute(
+            "TRUNCATE processed_events, audit_log, topics, audit_topic_rollup, "
+            "audit_worker_rollup RESTART IDENTITY CASCADE"
+        )
+
+        if drop_stats_shards:
+            await connection.execute("DELETE FROM stats")
+        else:
+            await connection.execute(
+                "UPDATE stats SET received = 0, unique_processed = 0, "
+                "duplicated_dropped = 0, updated_at = NOW()"
+            )
+    finally:
+        await connection.close()
+
+
+async def reset_queue(redis_url: str) -> None:
+    client: Redis = Redis.from_url(url=redis_url)  # type: ignore[type-arg]
+    try:
+        keys: list[bytes | str] = await client.keys("events*")
+        if keys:
+            _ = await client.delete(*keys)
+    finally:
+        await client.close()
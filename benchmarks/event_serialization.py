@@ -0,0 +1,96 @@
+from datetime import UTC, datetime
+from os import getenv
+from time import perf_counter
+
+from loguru import logger
+from orjson import OPT_UTC_Z, Fragment, dumps, loads
+from src.aggregator.app.models.event_response import EventResponseModel
+from src.aggregator.app.models.events import EventModel, EventPayloadModel
+
+EVENT_COUNTS: list[int] = [10_000, 100_000]
+
+
+def build_rows(count: int) -> list[dict[str, object]]:
+    timestamp: datetime = datetime.now(UTC)
+
+    return [
+        {
+            "id": i,
+            "event_id": f"bench-event-{i}",
+            "topic": f"bench-topic-{i % 5}",
+            "source": "benchmark",
+            "payload": dumps(
+                {"message": f"Benchmark {i}", "timestamp": "2025-01-01T00:00:00"}
+            ).decode("utf-8"),
+            "timestamp": timestamp,
+        }
+        for i in range(count)
+    ]
+
+
+def serialize_with_models(rows: list[dict[str, object]]) -> bytes:
+    events: list[EventModel] = [
+        EventModel(
+            event_id=str(row["event_id"]),
+            topic=str(row["topic"]),
+            source=str(row["source"]),
+            payload=EventPayloadModel.model_validate(loads(str(row["payload"]))),
+            timestamp=row["timestamp"],  # type: ignore[arg-type]
+        )
+        for row in rows
+    ]
+
+    response: EventResponseModel = EventResponseModel(count=len(events), events=events)
+    validated: EventResponseModel = EventResponseModel.model_validate(
+        response.model_dump()
+    )
+    return validated.model_dump_json().encode("utf-8")
+
+
+def serialize_raw(rows: list[dict[str, object]]) -> bytes:
+    events: list[dict[str, object]] = [
+        {
+            "event_id": row["event_id"],
+            "topic": row["topic"],
+            "source": row["source"],
+            "payload": Fragment(str(row["payload"])),
+            "timestamp": row["timestamp"],
+        }
+        for row in rows
+    ]
+
+    return dumps(
+        {"count": len(events), "events": events, "next_cursor": None},
+        option=OPT_UTC_Z,
+    )
+
+
+def best_of(rows: list[dict[str, object]], serializer_name: str, repeat: int) -> float:
+    serializer = serialize_with_models if serializer_name == "models" else serialize_raw
+    timings: list[float] = []
+
+    for _ in range(repeat):
+        start_time: float = perf_counter()
+        _ = serializer(rows)
+        timings.append(perf_counter() - start_time)
+
+    return min(timings)
+
+
+def main() -> None:
+    repeat: int = int(getenv("REPEAT", default="5"))
+
+    for count in EVENT_COUNTS:
+        rows: list[dict[str, object]] = build_rows(count)
+
+        model_time: float = best_of(rows, "models", repeat)
+        raw_time: float = best_of(rows, "raw", repeat)
+
+        logger.info(
+            f"events={count:>7}: models={model_time * 1000:.1f}ms "
+            f"raw={raw_time * 1000:.1f}ms ({model_time / raw_time:.1f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
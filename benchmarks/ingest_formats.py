@@ -0,0 +1,91 @@
+from collections.abc import Callable
+from datetime import datetime
+from os import getenv
+from time import process_time
+
+from loguru import logger
+from orjson import dumps
+from src.aggregator.app.models.events import EventModel
+from src.aggregator.app.models.publish_request import (
+    EventRequestModel,
+    PublishRequestModel,
+)
+
+ROUNDS: int = 5
+
+
+def build_events(count: int) -> list[dict[str, object]]:
+    timestamp: str = datetime.now().isoformat()
+
+    return [
+        {
+            "event_id": f"bench-event-{i}",
+            "topic": f"bench-topic-{i % 5}",
+            "source": "benchmark",
+            "payload": {"message": f"Benchmark {i}", "timestamp": timestamp},
+            "timestamp": timestamp,
+        }
+        for i in range(count)
+    ]
+
+
+def ingest_json(body: bytes) -> list[tuple[str, bytes]]:
+    request: PublishRequestModel = PublishRequestModel.model_validate_json(body)
+    events: list[EventModel] = [
+        EventModel(
+            event_id=event_request.event_id,
+            topic=event_request.topic,
+            source=event_request.source,
+            payload=event_request.payload,
+            timestamp=event_request.timestamp,
+        )
+        for event_request in request.events
+    ]
+
+    return [(event.topic, dumps(event.model_dump(mode="json"))) for event in events]
+
+
+def ingest_ndjson(body: bytes) -> list[tuple[str, bytes]]:
+    lines: list[tuple[str, bytes]] = []
+
+    for line in body.split(b"\n"):
+        if line:
+            event: EventRequestModel = EventRequestModel.model_validate_json(line)
+            lines.append((event.topic, line))
+
+    return lines
+
+
+def measure(
+    name: str,
+    body: bytes,
+    event_count: int,
+    ingest: Callable[[bytes], list[tuple[str, bytes]]],
+) -> None:
+    best_time: float = float("inf")
+    for _ in range(ROUNDS):
+        start_time: float = process_time()
+        _ = ingest(body)
+        best_time = min(best_time, process_time() - start_time)
+
+    logger.info(
+        f"{name:<6}: {best_time * 1_000_000 / event_count:.2f}us CPU/event "
+        f"({len(body) / event_count:.0f} bytes/event)"
+    )
+
+
+def main() -> None:
+    event_count: int = int(getenv("EVENT_COUNT", default="10000"))
+    events: list[dict[str, object]] = build_events(event_count)
+
+    measure("json", dumps({"events": events}), event_count, ingest_json)
+    measure(
+        "ndjson",
+        b"\n".join(dumps(event) for event in events),
+        event_count,
+        ingest_ndjson,
+    )
+
+
+if __name__ == "__main__":
+    main()
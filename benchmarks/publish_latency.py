@@ -0,0 +1,49 @@
+from os import getenv
+from statistics import quantiles
+from time import perf_counter
+from uuid import uuid4
+
+from loguru import logger
+from utils.testing import create_events, post_request
+
+BATCH_SIZES: list[int] = [1, 100, 1000, 10000]
+
+
+def measure(url: str, batch_size: int, iterations: int) -> list[float]:
+    latencies: list[float] = []
+
+    for _ in range(iterations):
+        events = create_events(
+            count=batch_size, topic="bench-publish", prefix=f"bench-{uuid4().hex}"
+        )
+
+        start_time: float = perf_counter()
+        status, response = post_request(url, {"events": events}, timeout=120)
+        elapsed_time: float = perf_counter() - start_time
+
+        if status != 200:
+            raise RuntimeError(f"Publish failed with status {status}: {response}")
+
+        latencies.append(elapsed_time * 1000)
+
+    return latencies
+
+
+def main() -> None:
+    server_url: str = getenv("SERVER_URL", default="http://localhost:8080")
+    iterations: int = int(getenv("ITERATIONS", default="50"))
+
+    url: str = f"{server_url}/publish"
+
+    for batch_size in BATCH_SIZES:
+        latencies: list[float] = measure(url, batch_size, iterations)
+        percentiles: list[float] = quantiles(latencies, n=100, method="inclusive")
+
+        logger.info(
+            f"batch_size={batch_size:>5}: p50={percentiles[49]:.1f}ms "
+            f"p99={percentiles[98]:.1f}ms ({iterations} requests)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+from asyncio import Future, Task, create_task, gather, run, sleep
+from os import getenv
+from statistics import quantiles
+from time import perf_counter
+from uuid import uuid4
+
+from httpx import AsyncClient, Limits, Response
+from loguru import logger
+from orjson import dumps, loads
+from redis.asyncio import Redis
+from utils.testing import create_events
+
+BATCH_SIZE: int = 100
+
+
+class OverloadReport:
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.accepted: int = 0
+        self.rejected: int = 0
+        self.failed: int = 0
+
+
+def build_body() -> bytes:
+    events = create_events(
+        count=BATCH_SIZE, topic="bench-overload", prefix=f"bench-{uuid4().hex}"
+    )
+    return dumps({"events": events})
+
+
+async def received_count(client: AsyncClient, server_url: str) -> int:
+    response: Response = await client.get(f"{server_url}/stats")
+    return loads(response.content)["received"]
+
+
+async def publish(
+    client: AsyncClient, url: str, body: bytes, report: OverloadReport
+) -> None:
+    start_time: float = perf_counter()
+
+    try:
+        response: Response = await client.post(
+            url, content=body, headers={"Content-Type": "application/json"}
+        )
+    except Exception:
+        report.failed += 1
+        return
+
+    if response.status_code == 200:
+        report.accepted += 1
+        report.latencies.append((perf_counter() - start_time) * 1000)
+    elif response.status_code in (413, 429):
+        report.rejected += 1
+    else:
+        report.failed += 1
+
+
+async def publish_until(
+    client: AsyncClient, url: str, deadline: float, report: OverloadReport
+) -> None:
+    while perf_counter() < deadline:
+        await publish(client, url, build_body(), report)
+
+
+async def publish_at_rate(
+    client: AsyncClient, url: str, rate: float, duration: float, report: OverloadReport
+) -> None:
+    tasks: set[Task[None]] = set()
+    start_time: float = perf_counter()
+    batch_number: int = 0
+
+    while (elapsed_time := perf_counter() - start_time) < duration:
+        await sleep(max(0, batch_number * BATCH_SIZE / rate - elapsed_time))
+
+        task: Task[None] = create_task(publish(client, url, build_body(), report))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        batch_number += 1
+
+    _ = await gather(*tasks)
+
+
+async def measure_capacity(
+    client: AsyncClient, server_url: str, duration: float
+) -> float:
+    report: OverloadReport = OverloadReport()
+    deadline: float = perf_counter() + duration
+    publisher: Future[list[None]] = gather(
+        *(
+            publish_until(client, f"{server_url}/publish", deadline, report)
+            for _ in range(16)
+        )
+    )
+
+    await sleep(duration / 2)
+    start_count: int = await received_count(client, server_url)
+    start_time: float = perf_counter()
+
+    _ = await publisher
+    capacity: float = (await received_count(client, server_url) - start_count) / (
+        perf_counter() - start_time
+    )
+
+    while (await client.get(f"{server_url}/workers")).json()["backlog"] > 0:
+        await sleep(1)
+
+    return capacity
+
+
+async def main() -> None:
+    server_url: str = getenv("SERVER_URL", default="http://localhost:8080")
+    redis_url: str = getenv(key="REDIS_URL", default="redis://localhost:6379/0")
+    capacity: float = float(getenv("CONSUMER_CAPACITY", default="0"))
+    overload_factor: float = float(getenv("OVERLOAD_FACTOR", default="2"))
+    duration: float = float(getenv("DURATION", default="60"))
+    window: float = float(getenv("WINDOW", default="10"))
+
+    redis: Redis = Redis.from_url(url=redis_url)  # type: ignore[type-arg]
+
+    async with AsyncClient(
+        timeout=60, limits=Limits(max_connections=64, max_keepalive_connections=64)
+    ) as client:
+        if capacity <= 0:
+            capacity = await measure_capacity(client, server_url, duration=20)
+
+        rate: float = capacity * overload_factor
+        logger.info(
+            f"Consumer capacity {capacity:,.0f} events/s, "
+            f"publishing at {rate:,.0f} events/s for {duration:.0f}s"
+        )
+
+        report: OverloadReport = OverloadReport()
+        publisher: Task[None] = create_task(
+            publish_at_rate(client, f"{server_url}/publish", rate, duration, report)
+        )
+
+        start_time: float = perf_counter()
+        window_start: int = 0
+        max_memory: int = 0
+        max_backlog: int = 0
+
+        while not publisher.done():
+            await sleep(1)
+
+            memory: int = (await redis.info("memory"))["used_memory"]
+            backlog: int = (await client.get(f"{server_url}/workers")).json()["backlog"]
+            max_memory = max(max_memory, memory)
+            max_backlog = max(max_backlog, backlog)
+
+            if perf_counter() - start_time < window and not publisher.done():
+                continue
+
+            latencies: list[float] = report.latencies[window_start:]
+            window_start = len(report.latencies)
+            start_time = perf_counter()
+
+            if len(latencies) < 2:
+                logger.info(f"backlog={backlog:>8}: no accepted requests in window")
+                continue
+
+            percentiles: list[float] = quantiles(latencies, n=100, method="inclusive")
+            logger.info(
+                f"backlog={backlog:>8} redis={memory / 1024 / 1024:>7.1f}MiB: "
+                f"p50={percentiles[49]:.1f}ms p99={percentiles[98]:.1f}ms "
+                f"({len(latencies)} accepted)"
+            )
+
+        await publisher
+
+    await redis.close()
+
+    logger.info(
+        f"{report.accepted} accepted, {report.rejected} rejected, "
+        f"{report.failed} failed requests; max backlog {max_backlog}, "
+        f"max Redis memory {max_memory / 1024 / 1024:.1f}MiB"
+    )
+
+
+if __name__ == "__main__":
+    run(main=main())
@@ -0,0 +1,81 @@
+from asyncio import run
+from datetime import datetime
+from os import environ, getenv
+from time import perf_counter
+
+from loguru import logger
+from redis.asyncio import Redis
+from src.aggregator.app.models.events import (
+    EventModel,
+    EventPayloadModel,
+    QueuedEventModel,
+)
+from src.aggregator.app.services.redis_queue import (
+    LIST_KEY,
+    STREAM_KEY,
+    RedisQueueService,
+)
+
+BACKENDS: list[str] = ["list", "stream"]
+
+
+def build_events(count: int) -> list[EventModel]:
+    timestamp: datetime = datetime.now()
+
+    return [
+        EventModel(
+            event_id=f"bench-event-{i}",
+            topic=f"bench-topic-{i % 5}",
+            source="benchmark",
+            payload=EventPayloadModel(message=f"Benchmark {i}", timestamp=timestamp),
+            timestamp=timestamp,
+        )
+        for i in range(count)
+    ]
+
+
+async def main() -> None:
+    redis_url: str = getenv(key="REDIS_URL", default="redis://localhost:6379/0")
+    event_count: int = int(getenv("EVENT_COUNT", default="100000"))
+    batch_size: int = int(getenv("CONSUMER_BATCH_SIZE", default="100"))
+
+    logger.warning(f"Benchmark deletes the queue keys in {redis_url}")
+
+    events: list[EventModel] = build_events(event_count)
+    queue: RedisQueueService = RedisQueueService()
+
+    for backend in BACKENDS:
+        client: Redis = Redis.from_url(url=redis_url)  # type: ignore[type-arg]
+        _ = await client.delete(LIST_KEY, STREAM_KEY)
+        await client.close()
+
+        environ["QUEUE_BACKEND"] = backend
+        await queue.initialize()
+
+        try:
+            start_time: float = perf_counter()
+            for i in range(0, len(events), 1000):
+                await queue.push_many(events[i : i + 1000])
+            push_time: float = perf_counter() - start_time
+
+            drained: int = 0
+            start_time = perf_counter()
+            while drained < event_count:
+                messages: list[QueuedEventModel] = await queue.pop_many(
+                    consumer="benchmark", count=batch_size, timeout=1
+                )
+                await queue.ack(messages)
+                drained += len(messages)
+            drain_time: float = perf_counter() - start_time
+        finally:
+            await queue.close()
+
+        logger.info(
+            f"backend={backend:<6}: push {event_count / push_time:,.0f} events/s, "
+            f"pop+ack {event_count / drain_time:,.0f} events/s "
+            f"(batch size {batch_size})"
+        )
+
+
+if __name__ == "__main__":
+    run(main=main())
@@ -0,0 +1,112 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import Event, get_running_loop, run
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from os import environ, getenv
+from signal import SIGINT, SIGTERM, signal
+from time import sleep
+from types import FrameType
+
+from loguru import logger
+
+from .logger import configure_logger
+from .services.consumer import ConsumerService
+
+
+async def run_consumer() -> None:
+    configure_logger()
+
+    consumer: ConsumerService = ConsumerService()
+    stopping: Event = Event()
+
+    for signum in (SIGINT, SIGTERM):
+        get_running_loop().add_signal_handler(signum, stopping.set)
+
+    await consumer.initialize()
+    await consumer.start()
+
+    logger.info("ChronicleWeaver consumer started")
+
+    try:
+        _ = await stopping.wait()
+    finally:
+        await consumer.close()
+        logger.info("ChronicleWeaver consumer stopped")
+
+
+def run_process(process_index: int, process_count: int) -> None:
+    environ["CONSUMER_PROCESS_INDEX"] = str(process_index)
+    environ["CONSUMER_PROCESS_COUNT"] = str(process_count)
+
+    run(main=run_consumer())
+
+
+def supervise(process_count: int) -> None:
+    configure_logger()
+
+    processes: dict[int, BaseProcess] = {}
+    stopping: bool = False
+
+    def stop(_signum: int, _frame: FrameType | None) -> None:
+        nonlocal stopping
+        stopping = True
+
+    _ = signal(SIGINT, stop)
+    _ = signal(SIGTERM, stop)
+
+    logger.info(f"Supervising {process_count} consumer processes")
+
+    while not stopping:
+        for process_index in range(process_count):
+            process: BaseProcess | None = processes.get(process_index)
+            if process is not None and process.is_alive():
+                continue
+
+            if process is not None:
+                logger.warning(
+                    f"Consumer process {process_index} exited with code "
+                    f"{process.exitcode}, restarting"
+                )
+
+            process = get_context("spawn").Process(
+                target=run_process,
+                args=(process_index, process_count),
+                name=f"consumer-{process_index}",
+            )
+            process.start()
+            processes[process_index] = process
+
+        sleep(1)
+
+    for process in processes.values():
+        process.terminate()
+
+    for process in processes.values():
+        process.join(timeout=30)
+
+    logger.info("All consumer processes stopped")
+
+
+def parse_args() -> Namespace:
+    parser: ArgumentParser = ArgumentParser(description="ChronicleWeaver consumer")
+    _ = parser.add_argument(
+        "--processes",
+        type=int,
+        default=int(getenv("CONSUMER_PROCESSES", default="1")),
+        help="number of consumer processes, each with its own event loop and pool",
+    )
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args: Namespace = parse_args()
+
+    if args.processes > 1:
+        supervise(args.processes)
+    else:
+        run(main=run_consumer())
+
+
+if __name__ == "__main__":
+    main()
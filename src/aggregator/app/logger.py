@@ -0,0 +1,30 @@
+from os import getenv
+from sys import stderr
+from typing import TextIO
+
+from loguru import logger
+
+LOG_FORMATS: set[str] = {"text", "json"}
+EVENT_LOG_MODES: set[str] = {"each", "aggregate"}
+
+
+def configure_logger(sink: TextIO = stderr) -> None:
+    log_format: str = getenv("LOG_FORMAT", default="text")
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unsupported LOG_FORMAT: {log_format}")
+
+    logger.remove()
+    _ = logger.add(
+        sink,
+        level=getenv("LOG_LEVEL", default="INFO"),
+        serialize=log_format == "json",
+        enqueue=getenv("LOG_ENQUEUE", default="false").lower() == "true",
+    )
+
+
+def get_event_log_mode() -> str:
+    event_log_mode: str = getenv("LOG_EVENT_MODE", default="each")
+    if event_log_mode not in EVENT_LOG_MODES:
+        raise ValueError(f"Unsupported LOG_EVENT_MODE: {event_log_mode}")
+
+    return event_log_mode
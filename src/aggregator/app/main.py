@@ -1,38 +1,70 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import UTC, datetime
 from os import getenv
 from typing import cast
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from loguru import logger
-
+from orjson import OPT_APPEND_NEWLINE, OPT_UTC_Z, dumps
+from pydantic import ValidationError
+
+from .logger import configure_logger, get_event_log_mode
+from .metrics import POOL_CONNECTIONS, PUBLISH_REJECTED, QUEUE_DEPTH, render_metrics
+from .middleware import (
+    AdmissionMiddleware,
+    GzipRequestMiddleware,
+    PublishTimingMiddleware,
+)
 from .models.audit import (
     AuditAction,
-    AuditLogModel,
     AuditLogResponseModel,
     AuditSummaryModel,
 )
+from .models.cursor import CursorModel
 from .models.event_response import EventResponseModel
 from .models.events import EventModel
-from .models.publish_request import PublishRequestModel
-from .models.stats_response import StatsResponseModel
+from .models.publish_request import EventRequestModel, PublishRequestModel
+from .models.stats_response import (
+    LatencyPercentilesModel,
+    LatencyStatsResponseModel,
+    StatsResponseModel,
+    TopicLatencyModel,
+)
+from .models.workers_response import PoolStatsModel, WorkersResponseModel
+from .services.admission import AdmissionService
 from .services.consumer import ConsumerService
 from .services.redis_queue import RedisQueueService
 
+CONSUMER_MODES: set[str] = {"embedded", "external"}
+
+configure_logger()
+PUBLISH_LOG_LEVEL: str = "INFO" if get_event_log_mode() == "each" else "DEBUG"
+
+admission: AdmissionService = AdmissionService()
 consumer: ConsumerService = ConsumerService()
 redis_queue: RedisQueueService = RedisQueueService()
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    consumer_mode: str = getenv("CONSUMER_MODE", default="embedded")
+    if consumer_mode not in CONSUMER_MODES:
+        raise ValueError(f"Unsupported CONSUMER_MODE: {consumer_mode}")
+
     await consumer.initialize()
-    await consumer.start()
+
+    if consumer_mode == "embedded":
+        await consumer.start()
+
+    await admission.start()
 
     logger.info("ChronicleWeaver aggregator started")
 
     yield
 
+    await admission.stop()
     await consumer.close()
     logger.info("ChronicleWeaver aggregator stopped")
 
@@ -43,6 +75,9 @@ app: FastAPI = FastAPI(
     version="0.2.0",
     lifespan=lifespan,
 )
+app.add_middleware(GzipRequestMiddleware, max_body_bytes=admission.get_max_body_bytes())
+app.add_middleware(PublishTimingMiddleware)
+app.add_middleware(AdmissionMiddleware, admission=admission)
 
 
 @app.get(path="/")
@@ -52,33 +87,33 @@ def root() -> dict[str, str]:
 
 @app.post(path="/publish")
 async def publish_events(request: PublishRequestModel) -> dict[str, str | int]:
+    _check_batch_size(len(request.events))
+    _check_shedding(event.topic for event in request.events)
+
+    ingested_at: datetime = datetime.now(UTC)
+
     try:
-        for event_request in request.events:
-            event: EventModel = EventModel(
+        events: list[EventModel] = [
+            EventModel(
                 event_id=event_request.event_id,
                 topic=event_request.topic,
                 source=event_request.source,
                 payload=event_request.payload,
                 timestamp=event_request.timestamp,
+                ingested_at=ingested_at,
             )
+            for event_request in request.events
+        ]
 
-            await consumer.log_audit(
-                event_id=event.event_id,
-                topic=event.topic,
-                source=event.source,
-                action=AuditAction.RECEIVED,
-            )
+        await consumer.log_audit_many(events, AuditAction.RECEIVED)
 
-            await redis_queue.push(event)
+        await redis_queue.push_many(events)
 
-            await consumer.log_audit(
-                event_id=event.event_id,
-                topic=event.topic,
-                source=event.source,
-                action=AuditAction.QUEUED,
-            )
+        await consumer.log_audit_many(events, AuditAction.QUEUED)
 
-        logger.info(f"Published {len(request.events)} events to queue")
+        logger.log(
+            PUBLISH_LOG_LEVEL, f"Published {len(request.events)} events to queue"
+        )
 
         return {
             "status": "success",
@@ -92,15 +127,129 @@ async def publish_events(request: PublishRequestModel) -> dict[str, str | int]:
         )
 
 
+@app.post(path="/publish/ndjson")
+async def publish_ndjson(request: Request) -> dict[str, str | int]:
+    ingested_at: datetime = datetime.now(UTC)
+    stamp: bytes = b'{"ingested_at":"%s",' % ingested_at.isoformat().encode()
+    events: list[EventRequestModel] = []
+    lines: list[tuple[str, bytes]] = []
+    line_number: int = 0
+
+    async for line in _ndjson_lines(request):
+        line_number += 1
+
+        if not line:
+            continue
+
+        try:
+            event: EventRequestModel = EventRequestModel.model_validate_json(line)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid event on line {line_number}: {e}",
+            )
+
+        events.append(event)
+        lines.append((event.topic, _stamp_line(line, event, ingested_at, stamp)))
+        _check_batch_size(len(events))
+
+    _check_shedding(topic for topic, _ in lines)
+
+    try:
+        await consumer.log_audit_many(events, AuditAction.RECEIVED)
+
+        await redis_queue.push_raw(lines)
+
+        await consumer.log_audit_many(events, AuditAction.QUEUED)
+
+        logger.log(PUBLISH_LOG_LEVEL, f"Published {len(events)} events to queue")
+
+        return {
+            "status": "success",
+            "message": f"Published {len(events)} events",
+            "events_count": len(events),
+        }
+    except Exception as e:
+        logger.error(f"Failed to publish events: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to publish events: {str(e)}"
+        )
+
+
+def _stamp_line(
+    line: bytes, event: EventRequestModel, ingested_at: datetime, stamp: bytes
+) -> bytes:
+    if b'"ingested_at"' not in line and b"\\u" not in line:
+        return stamp + line[1:]
+
+    return dumps(
+        EventModel(**event.model_dump(), ingested_at=ingested_at).model_dump(
+            mode="json"
+        )
+    )
+
+
+def _check_batch_size(event_count: int) -> None:
+    max_events: int = admission.get_max_events()
+    if 0 < max_events < event_count:
+        PUBLISH_REJECTED.inc("too_large")
+        raise HTTPException(
+            status_code=413,
+            detail=f"Request exceeds {max_events} events",
+        )
+
+
+def _check_shedding(topics: Iterable[str]) -> None:
+    if admission.should_shed(topics):
+        PUBLISH_REJECTED.inc("low_priority")
+        raise HTTPException(
+            status_code=429,
+            detail="Queue is backlogged, low-priority topics are shed",
+            headers={"Retry-After": str(admission.get_retry_after())},
+        )
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    buffer: bytes = b""
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+
+        for line in lines:
+            yield line.strip()
+
+    yield buffer.strip()
+
+
 @app.get(path="/events", response_model=EventResponseModel)
-async def get_events(topic: str | None = None) -> EventResponseModel:
+async def get_events(
+    topic: str | None = None,
+    after: str | None = Query(
+        default=None, description="Cursor from a previous page's next_cursor"
+    ),
+    limit: int | None = Query(
+        default=None, ge=1, le=10000, description="Max events per page"
+    ),
+) -> Response:
+    cursor: CursorModel | None = _decode_cursor(after)
+
     try:
-        if topic is None:
-            events: list[EventModel] = await consumer.get_all_events()
-        else:
-            events = await consumer.get_events_by_topic(topic)
+        events, next_cursor = await consumer.get_events(
+            topic=topic, after=cursor, limit=limit
+        )
 
-        return EventResponseModel(count=len(events), events=events)
+        return Response(
+            content=dumps(
+                {
+                    "count": len(events),
+                    "events": events,
+                    "next_cursor": next_cursor.encode() if next_cursor else None,
+                },
+                option=OPT_UTC_Z,
+            ),
+            media_type="application/json",
+        )
     except Exception as e:
         logger.error(f"Failed to retrieve events: {e}")
         raise HTTPException(
@@ -108,6 +257,32 @@ async def get_events(topic: str | None = None) -> EventResponseModel:
         )
 
 
+@app.get(path="/events/stream")
+async def stream_events(
+    topic: str | None = None,
+    after: str | None = Query(
+        default=None, description="Cursor from a previous page's next_cursor"
+    ),
+) -> StreamingResponse:
+    cursor: CursorModel | None = _decode_cursor(after)
+
+    async def ndjson_lines() -> AsyncIterator[bytes]:
+        async for event in consumer.stream_events(topic=topic, after=cursor):
+            yield dumps(event, option=OPT_UTC_Z | OPT_APPEND_NEWLINE)
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+def _decode_cursor(after: str | None) -> CursorModel | None:
+    if after is None:
+        return None
+
+    try:
+        return CursorModel.decode(after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @app.get(path="/stats", response_model=StatsResponseModel)
 async def get_stats() -> StatsResponseModel:
     try:
@@ -127,6 +302,82 @@ async def get_stats() -> StatsResponseModel:
         )
 
 
+def _latency_percentiles(values: list[float] | None) -> LatencyPercentilesModel | None:
+    if values is None or None in values:
+        return None
+
+    return LatencyPercentilesModel(p50=values[0], p90=values[1], p99=values[2])
+
+
+@app.get(path="/stats/latency", response_model=LatencyStatsResponseModel)
+async def get_latency_stats(
+    topic: str | None = Query(default=None, description="Filter by topic"),
+    sample: int = Query(
+        default=10000, ge=1, le=100000, description="Most recent events to sample"
+    ),
+) -> LatencyStatsResponseModel:
+    try:
+        rows: list[dict[str, object]] = await consumer.get_latency_stats(
+            topic=topic, sample=sample
+        )
+
+        return LatencyStatsResponseModel(
+            sample=sample,
+            topics=[
+                TopicLatencyModel(
+                    topic=cast(str, row["topic"]),
+                    count=cast(int, row["count"]),
+                    queue_ms=_latency_percentiles(cast(list[float], row["queue_ms"])),
+                    commit_ms=_latency_percentiles(cast(list[float], row["commit_ms"])),
+                )
+                for row in rows
+            ],
+        )
+    except Exception as e:
+        logger.error(f"Failed to retrieve latency stats: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retrieve latency stats: {str(e)}"
+        )
+
+
+@app.get(path="/workers", response_model=WorkersResponseModel)
+async def get_workers() -> WorkersResponseModel:
+    try:
+        workers: dict[str, object] = await consumer.get_worker_stats()
+
+        return WorkersResponseModel(
+            worker_count=cast(int, workers["worker_count"]),
+            min_workers=cast(int, workers["min_workers"]),
+            max_workers=cast(int, workers["max_workers"]),
+            backlog=cast(int, workers["backlog"]),
+            insert_latency_ms=cast(float, workers["insert_latency_ms"]),
+            pool=PoolStatsModel(**cast(dict[str, int], workers["pool"])),
+        )
+    except Exception as e:
+        logger.error(f"Failed to retrieve worker stats: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retrieve worker stats: {str(e)}"
+        )
+
+
+@app.get(path="/metrics")
+async def get_metrics() -> Response:
+    try:
+        workers: dict[str, object] = await consumer.get_worker_stats()
+    except Exception as e:
+        logger.error(f"Failed to retrieve metrics: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retrieve metrics: {str(e)}"
+        )
+
+    pool: dict[str, int] = cast(dict[str, int], workers["pool"])
+    QUEUE_DEPTH.set(value=cast(int, workers["backlog"]))
+    POOL_CONNECTIONS.set("in_use", value=pool["in_use"])
+    POOL_CONNECTIONS.set("idle", value=pool["idle"])
+
+    return Response(content=render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 @app.get(path="/audit", response_model=AuditLogResponseModel)
 async def get_audit_logs(
     action: str | None = Query(
@@ -141,19 +392,29 @@ async def get_audit_logs(
     to_time: datetime | None = Query(
         default=None, alias="to", description="End timestamp (ISO8601)"
     ),
+    after: str | None = Query(
+        default=None, description="Cursor from a previous page's next_cursor"
+    ),
     limit: int = Query(default=100, ge=1, le=1000, description="Max records to return"),
 ) -> AuditLogResponseModel:
+    cursor: CursorModel | None = _decode_cursor(after)
+
     try:
-        logs: list[AuditLogModel] = await consumer.get_audit_logs(
+        logs, next_cursor = await consumer.get_audit_logs(
             action=action,
             topic=topic,
             event_id=event_id,
             from_time=from_time,
             to_time=to_time,
+            after=cursor,
             limit=limit,
         )
 
-        return AuditLogResponseModel(count=len(logs), audit_logs=logs)
+        return AuditLogResponseModel(
+            count=len(logs),
+            audit_logs=logs,
+            next_cursor=next_cursor.encode() if next_cursor else None,
+        )
     except Exception as e:
         logger.error(f"Failed to retrieve audit logs: {e}")
         raise HTTPException(
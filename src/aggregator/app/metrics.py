@@ -0,0 +1,161 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterator
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+class Metric(ABC):
+    kind: str = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labels: tuple[str, ...] = ()
+    ) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labels: tuple[str, ...] = labels
+        REGISTRY.append(self)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self.samples()
+
+    @abstractmethod
+    def samples(self) -> Iterator[str]: ...
+
+    def format_labels(
+        self, label_values: tuple[str, ...], extra: tuple[tuple[str, str], ...] = ()
+    ) -> str:
+        pairs: list[tuple[str, str]] = [*zip(self.labels, label_values), *extra]
+        if not pairs:
+            return ""
+
+        return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+
+class Counter(Metric):
+    kind: str = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labels: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.__values: defaultdict[tuple[str, ...], float] = defaultdict(float)
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self.__values[label_values] += amount
+
+    def samples(self) -> Iterator[str]:
+        for label_values, value in self.__values.items():
+            yield f"{self.name}{self.format_labels(label_values)} {value}"
+
+
+class Gauge(Metric):
+    kind: str = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labels: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.__values: dict[tuple[str, ...], float] = {}
+
+    def set(self, *label_values: str, value: float) -> None:
+        self.__values[label_values] = value
+
+    def samples(self) -> Iterator[str]:
+        for label_values, value in self.__values.items():
+            yield f"{self.name}{self.format_labels(label_values)} {value}"
+
+
+class Histogram(Metric):
+    kind: str = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.__buckets: tuple[float, ...] = buckets
+        self.__counts: dict[tuple[str, ...], list[int]] = {}
+        self.__sums: defaultdict[tuple[str, ...], float] = defaultdict(float)
+
+    def observe(self, value: float, *label_values: str) -> None:
+        counts: list[int] | None = self.__counts.get(label_values)
+        if counts is None:
+            counts = self.__counts[label_values] = [0] * (len(self.__buckets) + 1)
+
+        counts[bisect_left(self.__buckets, value)] += 1
+        self.__sums[label_values] += value
+
+    def samples(self) -> Iterator[str]:
+        for label_values, counts in self.__counts.items():
+            cumulative: int = 0
+
+            for bound, count in zip((*self.__buckets, "+Inf"), counts):
+                cumulative += count
+                labels: str = self.format_labels(label_values, (("le", str(bound)),))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+
+            labels = self.format_labels(label_values)
+            yield f"{self.name}_sum{labels} {self.__sums[label_values]}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+REGISTRY: list[Metric] = []
+
+PUBLISH_SECONDS: Histogram = Histogram(
+    "chronicle_publish_request_seconds",
+    "Latency of publish requests",
+    ("endpoint",),
+)
+QUEUE_PUSH_SECONDS: Histogram = Histogram(
+    "chronicle_queue_push_seconds", "Latency of pushing a batch to the queue"
+)
+QUEUE_POP_SECONDS: Histogram = Histogram(
+    "chronicle_queue_pop_seconds", "Latency of non-empty pops from the queue"
+)
+INSERT_SECONDS: Histogram = Histogram(
+    "chronicle_insert_batch_seconds",
+    "Latency of inserting an event batch, by whether it stored any new event",
+    ("batch",),
+)
+POOL_ACQUIRE_SECONDS: Histogram = Histogram(
+    "chronicle_pool_acquire_seconds", "Time spent waiting for a pooled connection"
+)
+CONSUMER_EVENTS: Counter = Counter(
+    "chronicle_consumer_events_total",
+    "Events handled by each consumer worker",
+    ("worker_id", "result"),
+)
+PUBLISH_REJECTED: Counter = Counter(
+    "chronicle_publish_rejected_total",
+    "Publish requests rejected by admission control",
+    ("reason",),
+)
+QUEUE_DEPTH: Gauge = Gauge("chronicle_queue_depth", "Events waiting in the queue")
+POOL_CONNECTIONS: Gauge = Gauge(
+    "chronicle_pool_connections", "Database pool connections", ("state",)
+)
+
+
+def render_metrics() -> str:
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
@@ -0,0 +1,187 @@
+from time import perf_counter
+from zlib import decompressobj
+from zlib import error as ZlibError
+
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import PUBLISH_REJECTED, PUBLISH_SECONDS
+from .services.admission import AdmissionService
+
+GZIP_HEADER: tuple[bytes, bytes] = (b"content-encoding", b"gzip")
+PUBLISH_PATHS: set[str] = {"/publish", "/publish/ndjson"}
+
+
+class PublishTimingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.__app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in PUBLISH_PATHS:
+            await self.__app(scope, receive, send)
+            return
+
+        start_time: float = perf_counter()
+
+        try:
+            await self.__app(scope, receive, send)
+        finally:
+            PUBLISH_SECONDS.observe(perf_counter() - start_time, scope["path"])
+
+
+class AdmissionMiddleware:
+    def __init__(self, app: ASGIApp, admission: AdmissionService) -> None:
+        self.__app: ASGIApp = app
+        self.__admission: AdmissionService = admission
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in PUBLISH_PATHS:
+            await self.__app(scope, receive, send)
+            return
+
+        if self.__admission.is_overloaded():
+            PUBLISH_REJECTED.inc("overloaded")
+            response: JSONResponse = JSONResponse(
+                status_code=429,
+                content={"detail": "Queue is overloaded, retry later"},
+                headers={"Retry-After": str(self.__admission.get_retry_after())},
+            )
+            await response(scope, receive, send)
+            return
+
+        max_body_bytes: int = self.__admission.get_max_body_bytes()
+        if max_body_bytes <= 0:
+            await self.__app(scope, receive, send)
+            return
+
+        content_length: bytes | None = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > max_body_bytes:
+                PUBLISH_REJECTED.inc("too_large")
+                response = JSONResponse(
+                    status_code=413,
+                    content={"detail": f"Request body exceeds {max_body_bytes} bytes"},
+                )
+                await response(scope, receive, send)
+                return
+
+        received_bytes: int = 0
+        too_large: bool = False
+
+        async def receive_limited() -> Message:
+            nonlocal received_bytes, too_large
+
+            message: Message = await receive()
+            received_bytes += len(message.get("body", b""))
+
+            if received_bytes > max_body_bytes:
+                if not too_large:
+                    PUBLISH_REJECTED.inc("too_large")
+                too_large = True
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Request body exceeds {max_body_bytes} bytes",
+                )
+
+            return message
+
+        try:
+            await self.__app(scope, receive_limited, send)
+        except HTTPException as e:
+            if not too_large:
+                raise
+
+            response = JSONResponse(status_code=413, content={"detail": e.detail})
+            await response(scope, receive, send)
+
+
+class GzipRequestMiddleware:
+    def __init__(self, app: ASGIApp, max_body_bytes: int = 0) -> None:
+        self.__app: ASGIApp = app
+        self.__max_body_bytes: int = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] not in PUBLISH_PATHS
+            or GZIP_HEADER not in scope["headers"]
+        ):
+            await self.__app(scope, receive, send)
+            return
+
+        try:
+            body: bytes = await self.__inflate(receive)
+        except ZlibError as e:
+            response: JSONResponse = JSONResponse(
+                status_code=400, content={"detail": f"Invalid gzip request body: {e}"}
+            )
+            await response(scope, receive, send)
+            return
+        except OverflowError:
+            PUBLISH_REJECTED.inc("too_large")
+            response = JSONResponse(
+                status_code=413,
+                content={
+                    "detail": f"Request body exceeds {self.__max_body_bytes} bytes"
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        scope = {
+            **scope,
+            "headers": [
+                (name, value)
+                for name, value in scope["headers"]
+                if name not in (b"content-encoding", b"content-length")
+            ]
+            + [(b"content-length", str(len(body)).encode("latin-1"))],
+        }
+        body_sent: bool = False
+
+        async def receive_body() -> Message:
+            nonlocal body_sent
+
+            if body_sent:
+                return await receive()
+
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.__app(scope, receive_body, send)
+
+    async def __inflate(self, receive: Receive) -> bytes:
+        decompressor = decompressobj(wbits=31)
+        body: bytearray = bytearray()
+        more_body: bool = True
+
+        while more_body:
+            message: Message = await receive()
+            data: bytes = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            while data:
+                if decompressor.eof:
+                    decompressor = decompressobj(wbits=31)
+
+                body += decompressor.decompress(
+                    data,
+                    self.__max_body_bytes - len(body) + 1
+                    if self.__max_body_bytes > 0
+                    else 0,
+                )
+
+                if 0 < self.__max_body_bytes < len(body):
+                    raise OverflowError
+
+                data = (
+                    decompressor.unused_data
+                    if decompressor.eof
+                    else decompressor.unconsumed_tail
+                )
+
+        if not decompressor.eof:
+            raise ZlibError("compressed data ended before the end-of-stream marker")
+
+        return bytes(body)
@@ -25,6 +25,7 @@ class AuditLogModel(BaseModel):
 class AuditLogResponseModel(BaseModel):
     count: int
     audit_logs: list[AuditLogModel]
+    next_cursor: str | None = None
 
 
 class AuditSummaryTopicModel(BaseModel):
@@ -0,0 +1,16 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class CursorModel(BaseModel):
+    timestamp: datetime
+    id: int
+
+    def encode(self) -> str:
+        return urlsafe_b64encode(self.model_dump_json().encode("utf-8")).decode("utf-8")
+
+    @classmethod
+    def decode(cls, value: str) -> "CursorModel":
+        return cls.model_validate_json(urlsafe_b64decode(value.encode("utf-8")))
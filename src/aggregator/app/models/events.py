@@ -17,6 +17,9 @@ class EventModel(BaseModel):
     source: str
     payload: EventPayloadModel
     timestamp: datetime = Field(default=..., description="ISO 8601 timestamp")
+    ingested_at: datetime | None = Field(
+        default=None, description="Time the aggregator accepted the event"
+    )
 
     def model_dump(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
         data: dict[str, Any] = super().model_dump(**kwargs)
@@ -26,3 +29,9 @@ class EventModel(BaseModel):
             payload["timestamp"] = self.payload.timestamp.isoformat()
             data["payload"] = payload
         return data
+
+
+class QueuedEventModel(BaseModel):
+    queue: str
+    message_id: str | None = None
+    event: EventModel
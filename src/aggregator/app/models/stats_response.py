@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from pydantic.types import NonNegativeInt
+from pydantic.types import NonNegativeFloat, NonNegativeInt
 
 
 class StatsResponseModel(BaseModel):
@@ -8,3 +8,21 @@ class StatsResponseModel(BaseModel):
     duplicated_dropped: NonNegativeInt
     topics: list[str]
     uptime: NonNegativeInt
+
+
+class LatencyPercentilesModel(BaseModel):
+    p50: NonNegativeFloat
+    p90: NonNegativeFloat
+    p99: NonNegativeFloat
+
+
+class TopicLatencyModel(BaseModel):
+    topic: str
+    count: NonNegativeInt
+    queue_ms: LatencyPercentilesModel | None
+    commit_ms: LatencyPercentilesModel | None
+
+
+class LatencyStatsResponseModel(BaseModel):
+    sample: NonNegativeInt
+    topics: list[TopicLatencyModel]
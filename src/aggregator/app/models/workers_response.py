@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from pydantic.types import NonNegativeFloat, NonNegativeInt
+
+
+class PoolStatsModel(BaseModel):
+    size: NonNegativeInt
+    idle: NonNegativeInt
+    in_use: NonNegativeInt
+    min_size: NonNegativeInt
+    max_size: NonNegativeInt
+
+
+class WorkersResponseModel(BaseModel):
+    worker_count: NonNegativeInt
+    min_workers: NonNegativeInt
+    max_workers: NonNegativeInt
+    backlog: NonNegativeInt
+    insert_latency_ms: NonNegativeFloat
+    pool: PoolStatsModel
@@ -1,5 +1,17 @@
+from .admission import AdmissionService
+from .audit_partitions import AuditPartitionService
+from .audit_writer import AuditWriterService
 from .consumer import ConsumerService
 from .database import DatabaseService
+from .dedup_cache import DedupCacheService
 from .redis_queue import RedisQueueService
 
-__all__: list[str] = ["ConsumerService", "DatabaseService", "RedisQueueService"]
+__all__: list[str] = [
+    "AdmissionService",
+    "AuditPartitionService",
+    "AuditWriterService",
+    "ConsumerService",
+    "DatabaseService",
+    "DedupCacheService",
+    "RedisQueueService",
+]
@@ -0,0 +1,118 @@
+from asyncio import CancelledError, Task, create_task, sleep
+from collections.abc import Iterable
+from os import getenv
+
+from loguru import logger
+
+from ..metrics import QUEUE_DEPTH
+from .redis_queue import RedisQueueService
+
+
+class AdmissionService:
+    def __init__(self) -> None:
+        self.__redis_queue: RedisQueueService = RedisQueueService()
+        self.__high_watermark: int = int(
+            getenv(key="QUEUE_HIGH_WATERMARK", default="0")
+        )
+        self.__low_watermark: int = min(
+            self.__high_watermark,
+            int(
+                getenv(
+                    key="QUEUE_LOW_WATERMARK",
+                    default=str(self.__high_watermark * 4 // 5),
+                )
+            ),
+        )
+        self.__refresh_interval: float = float(
+            getenv(key="ADMISSION_REFRESH_INTERVAL", default="0.5")
+        )
+        self.__retry_after: int = max(
+            1, int(getenv(key="ADMISSION_RETRY_AFTER", default="1"))
+        )
+        self.__low_priority_topics: set[str] = {
+            topic.strip()
+            for topic in getenv(key="ADMISSION_LOW_PRIORITY_TOPICS", default="").split(
+                ","
+            )
+            if topic.strip()
+        }
+        self.__max_events: int = int(getenv(key="PUBLISH_MAX_EVENTS", default="10000"))
+        self.__max_body_bytes: int = int(
+            getenv(key="PUBLISH_MAX_BODY_BYTES", default=str(16 * 1024 * 1024))
+        )
+        self.__queue_depth: int = 0
+        self.__overloaded: bool = False
+        self.__task: Task[None] | None = None
+
+    async def start(self) -> None:
+        if self.__high_watermark <= 0 or self.__task is not None:
+            return
+
+        await self.__refresh()
+        self.__task = create_task(coro=self.__refresh_loop())
+
+        logger.info(
+            f"Admission control enabled (high watermark {self.__high_watermark}, "
+            f"low watermark {self.__low_watermark})"
+        )
+
+    async def __refresh_loop(self) -> None:
+        while True:
+            await sleep(self.__refresh_interval)
+
+            try:
+                await self.__refresh()
+            except CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Admission: Failed to refresh queue depth - {e}")
+
+    async def __refresh(self) -> None:
+        self.__queue_depth = await self.__redis_queue.length()
+        QUEUE_DEPTH.set(value=self.__queue_depth)
+
+        if not self.__overloaded and self.__queue_depth >= self.__high_watermark:
+            self.__overloaded = True
+            logger.warning(
+                f"Admission: Queue depth {self.__queue_depth} reached high watermark "
+                f"{self.__high_watermark}, rejecting publishes"
+            )
+        elif self.__overloaded and self.__queue_depth <= self.__low_watermark:
+            self.__overloaded = False
+            logger.info(
+                f"Admission: Queue depth {self.__queue_depth} drained to low "
+                f"watermark {self.__low_watermark}, accepting publishes"
+            )
+
+    def is_overloaded(self) -> bool:
+        return self.__overloaded
+
+    def should_shed(self, topics: Iterable[str]) -> bool:
+        return (
+            self.__high_watermark > 0
+            and self.__queue_depth >= self.__low_watermark
+            and not self.__low_priority_topics.isdisjoint(topics)
+        )
+
+    def get_retry_after(self) -> int:
+        return self.__retry_after
+
+    def get_max_events(self) -> int:
+        return self.__max_events
+
+    def get_max_body_bytes(self) -> int:
+        return self.__max_body_bytes
+
+    async def stop(self) -> None:
+        if self.__task is None:
+            return
+
+        _ = self.__task.cancel()
+
+        try:
+            await self.__task
+        except CancelledError:
+            pass
+
+        self.__task = None
+        logger.info("Admission control stopped")
@@ -0,0 +1,51 @@
+from asyncio import CancelledError, Task, create_task, sleep
+from os import getenv
+
+from loguru import logger
+
+from .database import DatabaseService
+
+
+class AuditPartitionService:
+    def __init__(self) -> None:
+        self.__database: DatabaseService = DatabaseService()
+        self.__interval: int = int(
+            getenv(key="AUDIT_MAINTENANCE_INTERVAL", default="300")
+        )
+        self.__task: Task[None] | None = None
+
+    async def start(self) -> None:
+        if self.__task is not None:
+            return
+
+        self.__task = create_task(coro=self.__maintenance_loop())
+
+    async def __maintenance_loop(self) -> None:
+        while True:
+            try:
+                created, dropped = await self.__database.maintain_audit_partitions()
+
+                if created or dropped:
+                    logger.info(
+                        f"Audit partitions: created {created}, dropped {dropped}"
+                    )
+            except CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Audit partitions: Maintenance failed - {e}")
+
+            await sleep(delay=self.__interval)
+
+    async def close(self) -> None:
+        if self.__task is None:
+            return
+
+        _ = self.__task.cancel()
+
+        try:
+            await self.__task
+        except CancelledError:
+            pass
+
+        self.__task = None
+        logger.info("Audit partition maintenance stopped")
@@ -0,0 +1,125 @@
+from asyncio import Queue, Task, create_task, get_running_loop, sleep, wait_for
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from os import getenv
+from typing import TypeAlias
+
+from asyncpg import DataError
+from loguru import logger
+
+from ..models.audit import AuditAction
+from ..models.events import EventModel
+from ..models.publish_request import EventRequestModel
+from .database import DatabaseService
+
+AuditRecord: TypeAlias = tuple[str, str, str, str, int | None, datetime]
+
+
+class AuditWriterService:
+    def __init__(self) -> None:
+        self.__database: DatabaseService = DatabaseService()
+        self.__buffer: Queue[AuditRecord] = Queue(
+            maxsize=int(getenv(key="AUDIT_BUFFER_SIZE", default="100000"))
+        )
+        self.__flush_size: int = int(getenv(key="AUDIT_FLUSH_SIZE", default="5000"))
+        self.__flush_interval: float = (
+            int(getenv(key="AUDIT_FLUSH_INTERVAL_MS", default="200")) / 1000
+        )
+        self.__running: bool = False
+        self.__task: Task[None] | None = None
+
+    async def start(self) -> None:
+        if self.__running:
+            return
+
+        self.__running = True
+        self.__task = create_task(coro=self.__flush_loop())
+
+    async def write_many(
+        self,
+        events: Sequence[EventModel | EventRequestModel],
+        action: AuditAction,
+        worker_id: int | None = None,
+    ) -> None:
+        created_at: datetime = datetime.now(UTC)
+
+        for event in events:
+            await self.__buffer.put(
+                (
+                    event.event_id,
+                    event.topic,
+                    event.source,
+                    action.value,
+                    worker_id,
+                    created_at,
+                )
+            )
+
+    async def __flush_loop(self) -> None:
+        while self.__running or not self.__buffer.empty():
+            records: list[AuditRecord] = await self.__collect()
+
+            if records:
+                await self.__flush(records)
+
+    async def __collect(self) -> list[AuditRecord]:
+        records: list[AuditRecord] = []
+        deadline: float = get_running_loop().time() + self.__flush_interval
+
+        while len(records) < self.__flush_size:
+            while not self.__buffer.empty() and len(records) < self.__flush_size:
+                records.append(self.__buffer.get_nowait())
+
+            remaining: float = deadline - get_running_loop().time()
+            if remaining <= 0 or len(records) >= self.__flush_size:
+                break
+
+            try:
+                records.append(await wait_for(self.__buffer.get(), timeout=remaining))
+            except TimeoutError:
+                break
+
+        return records
+
+    async def __flush(self, records: list[AuditRecord]) -> None:
+        max_retries: int = 5
+
+        for attempt in range(max_retries):
+            try:
+                await self.__database.copy_audit_records(records)
+                return
+            except DataError as e:
+                if len(records) == 1:
+                    logger.error(
+                        f"Audit writer: Dropped record rejected by the database - "
+                        f"event_id={records[0][0]!r}, topic={records[0][1]!r} - {e}"
+                    )
+                    return
+
+                middle: int = len(records) // 2
+                await self.__flush(records[:middle])
+                await self.__flush(records[middle:])
+                return
+            except Exception as e:
+                backoff_time: float = min(2 ** (attempt + 1), 30)
+
+                logger.error(
+                    f"Audit writer: Failed to flush {len(records)} records - {e}, "
+                    f"retry {attempt + 1}/{max_retries}, backoff {backoff_time}s"
+                )
+
+                if attempt < max_retries - 1:
+                    await sleep(delay=backoff_time)
+
+        logger.error(
+            f"Audit writer: Max retries exceeded, dropped {len(records)} records"
+        )
+
+    async def close(self) -> None:
+        self.__running = False
+
+        if self.__task is not None:
+            await self.__task
+            self.__task = None
+
+        logger.info("Audit writer flushed and stopped")
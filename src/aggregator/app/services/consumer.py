@@ -1,12 +1,27 @@
 from asyncio import CancelledError, Task, create_task, sleep
-from datetime import datetime
-from os import getenv
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import UTC, datetime
+from math import ceil
+from os import getenv, getpid
+from random import random
+from socket import gethostname
+from time import perf_counter
 
+from asyncpg import DataError
 from loguru import logger
 
+from ..logger import get_event_log_mode
+from ..metrics import CONSUMER_EVENTS
 from ..models.audit import AuditAction, AuditLogModel, AuditSummaryModel
-from ..models.events import EventModel
+from ..models.cursor import CursorModel
+from ..models.events import EventModel, QueuedEventModel
+from ..models.publish_request import EventRequestModel
+from .audit_partitions import AuditPartitionService
+from .audit_writer import AuditWriterService
 from .database import DatabaseService
+from .dedup_cache import DedupCacheService
+from .lane_scheduler import LaneScheduler
 from .redis_queue import RedisQueueService
 
 
@@ -14,30 +29,111 @@ class ConsumerService:
     def __init__(self) -> None:
         self.__database: DatabaseService = DatabaseService()
         self.__redis_queue: RedisQueueService = RedisQueueService()
+        self.__audit_writer: AuditWriterService = AuditWriterService()
+        self.__audit_partitions: AuditPartitionService = AuditPartitionService()
+        self.__dedup_cache: DedupCacheService = DedupCacheService()
+        self.__consumer_prefix: str = f"{gethostname()}-{getpid()}"
+        self.__process_index: int = int(
+            getenv(key="CONSUMER_PROCESS_INDEX", default="0")
+        )
+        self.__process_count: int = max(
+            1, int(getenv(key="CONSUMER_PROCESS_COUNT", default="1"))
+        )
         self.__running: bool = False
-        self.__tasks: list[Task[None]] = []
+        self.__tasks: dict[int, Task[None]] = {}
+        self.__autoscale_task: Task[None] | None = None
         self.__worker_count: int = int(getenv(key="WORKER_COUNT", default="4"))
+        self.__min_workers: int = max(
+            1,
+            int(getenv(key="WORKER_MIN_COUNT", default=str(self.__worker_count))),
+        )
+        self.__max_workers: int = max(
+            self.__min_workers,
+            int(getenv(key="WORKER_MAX_COUNT", default=str(self.__worker_count))),
+        )
+        self.__worker_count = min(
+            max(self.__worker_count, self.__min_workers), self.__max_workers
+        )
+        self.__autoscale_interval: float = float(
+            getenv(key="AUTOSCALE_INTERVAL", default="5")
+        )
+        self.__backlog_per_worker: int = max(
+            1, int(getenv(key="AUTOSCALE_BACKLOG_PER_WORKER", default="1000"))
+        )
+        self.__max_insert_latency_ms: float = float(
+            getenv(key="AUTOSCALE_MAX_INSERT_LATENCY_MS", default="500")
+        )
+        self.__worker_offset: int = self.__process_index * self.__max_workers
+        self.__insert_latency: float = 0.0
+        self.__strict_order: bool = (
+            getenv(key="QUEUE_STRICT_ORDER", default="false").lower() == "true"
+        )
+        self.__batch_size: int = int(getenv(key="CONSUMER_BATCH_SIZE", default="100"))
+        self.__batch_linger_ms: int = int(
+            getenv(key="CONSUMER_BATCH_LINGER_MS", default="0")
+        )
+        self.__event_log_mode: str = get_event_log_mode()
+        self.__log_sample_rate: float = float(
+            getenv(key="LOG_EVENT_SAMPLE_RATE", default="0")
+        )
+        self.__log_interval: float = float(
+            getenv(key="LOG_AGGREGATE_INTERVAL", default="10")
+        )
 
     async def initialize(self) -> None:
         await self.__database.initialize()
         await self.__redis_queue.initialize()
 
+        pool_max_size: int = self.__database.get_pool_stats()["max_size"]
+        if self.__max_workers >= pool_max_size:
+            logger.warning(
+                f"WORKER_MAX_COUNT {self.__max_workers} leaves no spare connections "
+                f"in a pool of {pool_max_size} (raise DB_POOL_MAX_SIZE)"
+            )
+
+        await self.__dedup_cache.initialize()
+        await self.__audit_writer.start()
+        await self.__audit_partitions.start()
+
     async def start(self) -> None:
         if self.__running:
             return
 
         self.__running = True
+        self.__scale_to(self.__worker_count)
 
-        for worker_id in range(self.__worker_count):
-            task: Task[None] = create_task(coro=self.__consume_loop(worker_id))
-            self.__tasks.append(task)
+        if self.__max_workers > self.__min_workers:
+            self.__autoscale_task = create_task(coro=self.__autoscale_loop())
 
-        logger.info(f"Started {self.__worker_count} consumer workers")
+        owned_count: int = len(self.__owned_partitions())
+        if owned_count < self.__max_workers:
+            if self.__strict_order:
+                logger.info(
+                    f"{owned_count} queue partitions for up to {self.__max_workers} "
+                    f"workers, leaving the extra workers idle (QUEUE_STRICT_ORDER)"
+                )
+            else:
+                logger.warning(
+                    f"Up to {self.__max_workers} workers share {owned_count} queue "
+                    f"partitions, so per-topic order is not preserved (raise "
+                    f"QUEUE_PARTITIONS or set QUEUE_STRICT_ORDER=true)"
+                )
+
+        logger.info(
+            f"Started {self.__worker_count} consumer workers "
+            f"(process {self.__process_index + 1}/{self.__process_count}, "
+            f"batch size {self.__batch_size}, linger {self.__batch_linger_ms}ms, "
+            f"autoscale {self.__min_workers}-{self.__max_workers})"
+        )
 
     async def stop(self) -> None:
         self.__running = False
 
-        for task in self.__tasks:
+        tasks: list[Task[None]] = list(self.__tasks.values())
+        if self.__autoscale_task is not None:
+            tasks.append(self.__autoscale_task)
+
+        for task in tasks:
             _ = task.cancel()
 
             try:
@@ -46,34 +142,185 @@ class ConsumerService:
                 pass
 
         self.__tasks.clear()
+        self.__autoscale_task = None
         logger.info("All consumer workers stopped")
 
-    async def __consume_loop(self, worker_id: int) -> None:
+    def __scale_to(self, worker_count: int) -> None:
+        self.__worker_count = worker_count
+
+        for worker_index in range(worker_count):
+            task: Task[None] | None = self.__tasks.get(worker_index)
+            if task is None or task.done():
+                self.__tasks[worker_index] = create_task(
+                    coro=self.__consume_loop(worker_index)
+                )
+
+    def __target_worker_count(self, backlog: int) -> int:
+        desired: int = min(
+            max(ceil(backlog / self.__backlog_per_worker), self.__min_workers),
+            self.__max_workers,
+        )
+
+        if desired > self.__worker_count:
+            if self.__insert_latency * 1000 > self.__max_insert_latency_ms:
+                return self.__worker_count
+            return desired
+
+        if desired < self.__worker_count:
+            return self.__worker_count - 1
+
+        return desired
+
+    async def __autoscale_loop(self) -> None:
+        while self.__running:
+            await sleep(delay=self.__autoscale_interval)
+
+            try:
+                backlog: int = await self.__redis_queue.length()
+            except Exception as e:
+                logger.error(f"Autoscaler: Failed to read queue backlog - {e}")
+                continue
+
+            worker_count: int = self.__target_worker_count(backlog)
+            if worker_count == self.__worker_count:
+                continue
+
+            logger.info(
+                f"Autoscaler: Scaling consumer workers "
+                f"{self.__worker_count} -> {worker_count} (backlog {backlog}, "
+                f"insert latency {self.__insert_latency * 1000:.1f}ms)"
+            )
+            self.__scale_to(worker_count)
+
+    def __owned_partitions(self) -> list[int]:
+        partition_count: int = self.__redis_queue.get_partition_count()
+
+        owned: list[int] = [
+            partition
+            for partition in range(partition_count)
+            if partition % self.__process_count == self.__process_index
+        ]
+
+        if owned or self.__strict_order:
+            return owned
+
+        return [self.__process_index % partition_count]
+
+    def __assign_partitions(self, worker_index: int) -> list[int]:
+        owned: list[int] = self.__owned_partitions()
+
+        assigned: list[int] = [
+            partition
+            for i, partition in enumerate(owned)
+            if i % self.__worker_count == worker_index
+        ]
+
+        if assigned or self.__strict_order:
+            return assigned
+
+        return [owned[worker_index % len(owned)]]
+
+    async def __consume_loop(self, worker_index: int) -> None:
+        worker_id: int = self.__worker_offset + worker_index
         retry_count: int = 0
         max_retries: int = 5
+        partitions: list[int] = []
+        window_start: float = perf_counter()
+        window_events: int = 0
+        window_dropped: int = 0
+        scheduler: LaneScheduler = LaneScheduler(
+            self.__redis_queue.get_lane_weights(), self.__batch_size
+        )
+
+        while self.__running and worker_index < self.__worker_count:
+            assigned: list[int] = self.__assign_partitions(worker_index)
+            if assigned != partitions:
+                partitions = assigned
+                logger.info(f"Worker {worker_id}: Assigned partitions {partitions}")
+
+            if not partitions:
+                await sleep(delay=1)
+                continue
 
-        while self.__running:
             try:
-                event: EventModel | None = await self.__redis_queue.pop(timeout=5)
+                lanes: list[str] = scheduler.order()
+                messages: list[QueuedEventModel] = await self.__redis_queue.pop_many(
+                    consumer=f"{self.__consumer_prefix}-{worker_id}",
+                    count=self.__batch_size,
+                    timeout=5,
+                    linger_ms=self.__batch_linger_ms,
+                    partitions=partitions,
+                    lanes=lanes,
+                )
 
-                if event is None:
+                if not messages:
                     continue
 
+                scheduler.record(
+                    lanes,
+                    Counter(
+                        self.__redis_queue.lane_of(message) for message in messages
+                    ),
+                )
+
+                dequeued_at: datetime = datetime.now(UTC)
                 retry_count = 0
 
-                is_unique: bool = await self.__database.insert_event(event, worker_id)
+                start_time: float = perf_counter()
+                messages, results = await self.__insert_messages(
+                    messages, worker_id, dequeued_at
+                )
+                self.__insert_latency = 0.8 * self.__insert_latency + 0.2 * (
+                    perf_counter() - start_time
+                )
+
+                await self.__redis_queue.ack(messages)
+                events: list[EventModel] = [message.event for message in messages]
+                self.__dedup_cache.add(
+                    [(event.topic, event.event_id) for event in events]
+                )
+
+                processed: int = results.count(True)
+                CONSUMER_EVENTS.inc(str(worker_id), "processed", amount=processed)
+                CONSUMER_EVENTS.inc(
+                    str(worker_id), "dropped", amount=len(results) - processed
+                )
+
+                if self.__event_log_mode == "each":
+                    self.__log_events(worker_id, zip(events, results))
+                    continue
 
-                if is_unique:
-                    logger.info(
-                        f"Worker {worker_id}: Processed unique event - "
-                        f"event_id={event.event_id}, topic={event.topic}"
+                if self.__log_sample_rate > 0:
+                    self.__log_events(
+                        worker_id,
+                        (
+                            outcome
+                            for outcome in zip(events, results)
+                            if random() < self.__log_sample_rate
+                        ),
                     )
-                else:
-                    logger.warning(
-                        f"Worker {worker_id}: Duplicate event dropped - "
-                        f"event_id={event.event_id}, topic={event.topic}"
+
+                window_events += len(events)
+                window_dropped += len(results) - processed
+
+                elapsed_time: float = perf_counter() - window_start
+                if elapsed_time >= self.__log_interval:
+                    logger.bind(
+                        worker_id=worker_id,
+                        events=window_events,
+                        dropped=window_dropped,
+                        events_per_second=window_events / elapsed_time,
+                    ).info(
+                        f"Worker {worker_id}: {window_events} events in "
+                        f"{elapsed_time:.1f}s ({window_events / elapsed_time:,.0f} "
+                        f"events/s), duplicate ratio "
+                        f"{window_dropped / window_events:.1%}"
                     )
 
+                    window_start = perf_counter()
+                    window_events = 0
+                    window_dropped = 0
+
             except CancelledError:
                 raise
             except Exception as e:
@@ -93,15 +340,88 @@ class ConsumerService:
 
                 await sleep(delay=backoff_time)
 
-    async def get_events_by_topic(self, topic: str) -> list[EventModel]:
-        return await self.__database.get_events_by_topic(topic)
+    async def __insert_messages(
+        self,
+        messages: list[QueuedEventModel],
+        worker_id: int,
+        dequeued_at: datetime,
+    ) -> tuple[list[QueuedEventModel], list[bool]]:
+        events: list[EventModel] = [message.event for message in messages]
+
+        try:
+            results: list[bool] = await self.__database.insert_events(
+                events, worker_id, self.__dedup_cache.lookup(events), dequeued_at
+            )
+        except DataError as e:
+            if len(messages) == 1:
+                logger.error(
+                    f"Worker {worker_id}: Dead-lettering event rejected by the "
+                    f"database - event_id={events[0].event_id!r}, "
+                    f"topic={events[0].topic!r} - {e}"
+                )
+                await self.__redis_queue.dead_letter(messages)
+                return [], []
+
+            middle: int = len(messages) // 2
+            head, head_results = await self.__insert_messages(
+                messages[:middle], worker_id, dequeued_at
+            )
+            tail, tail_results = await self.__insert_messages(
+                messages[middle:], worker_id, dequeued_at
+            )
+            return head + tail, head_results + tail_results
 
-    async def get_all_events(self) -> list[EventModel]:
-        return await self.__database.get_all_events()
+        return messages, results
+
+    def __log_events(
+        self, worker_id: int, outcomes: Iterable[tuple[EventModel, bool]]
+    ) -> None:
+        for event, is_unique in outcomes:
+            if is_unique:
+                logger.info(
+                    f"Worker {worker_id}: Processed unique event - "
+                    f"event_id={event.event_id}, topic={event.topic}"
+                )
+            else:
+                logger.warning(
+                    f"Worker {worker_id}: Duplicate event dropped - "
+                    f"event_id={event.event_id}, topic={event.topic}"
+                )
+
+    async def get_events(
+        self,
+        topic: str | None = None,
+        after: CursorModel | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, object]], CursorModel | None]:
+        return await self.__database.get_events(topic=topic, after=after, limit=limit)
+
+    def stream_events(
+        self, topic: str | None = None, after: CursorModel | None = None
+    ) -> AsyncIterator[dict[str, object]]:
+        return self.__database.stream_events(topic=topic, after=after)
 
     async def get_stats(self) -> dict[str, object]:
         return await self.__database.get_stats()
 
+    async def get_worker_stats(self) -> dict[str, object]:
+        return {
+            "worker_count": self.__worker_count,
+            "min_workers": self.__min_workers,
+            "max_workers": self.__max_workers,
+            "backlog": await self.__redis_queue.length(),
+            "insert_latency_ms": self.__insert_latency * 1000,
+            "pool": self.__database.get_pool_stats(),
+        }
+
+    async def get_latency_stats(
+        self, topic: str | None = None, sample: int = 10000
+    ) -> list[dict[str, object]]:
+        return await self.__database.get_latency_stats(topic=topic, sample=sample)
+
+    def get_dedup_cache_stats(self) -> dict[str, int]:
+        return self.__dedup_cache.get_stats()
+
     async def get_audit_logs(
         self,
         action: str | None = None,
@@ -109,31 +429,33 @@ class ConsumerService:
         event_id: str | None = None,
         from_time: datetime | None = None,
         to_time: datetime | None = None,
+        after: CursorModel | None = None,
         limit: int = 100,
-    ) -> list[AuditLogModel]:
+    ) -> tuple[list[AuditLogModel], CursorModel | None]:
         return await self.__database.get_audit_logs(
             action=action,
             topic=topic,
             event_id=event_id,
             from_time=from_time,
             to_time=to_time,
+            after=after,
             limit=limit,
         )
 
     async def get_audit_summary(self) -> AuditSummaryModel:
         return await self.__database.get_audit_summary()
 
-    async def log_audit(
+    async def log_audit_many(
         self,
-        event_id: str,
-        topic: str,
-        source: str,
+        events: Sequence[EventModel | EventRequestModel],
         action: AuditAction,
         worker_id: int | None = None,
     ) -> None:
-        await self.__database.log_audit(event_id, topic, source, action, worker_id)
+        await self.__audit_writer.write_many(events, action, worker_id)
 
     async def close(self) -> None:
         await self.stop()
+        await self.__audit_partitions.close()
+        await self.__audit_writer.close()
         await self.__redis_queue.close()
         await self.__database.close()
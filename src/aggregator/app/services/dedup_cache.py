@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from os import getenv
+
+from loguru import logger
+
+from ..models.events import EventModel
+from .database import DatabaseService
+
+
+class DedupCacheService:
+    def __init__(self) -> None:
+        self.__database: DatabaseService = DatabaseService()
+        self.__capacity: int = int(getenv(key="DEDUP_CACHE_SIZE", default="0"))
+        self.__keys: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.__capacity > 0
+
+    async def initialize(self) -> None:
+        if not self.enabled:
+            return
+
+        self.add(await self.__database.get_recent_event_keys(self.__capacity))
+
+        logger.info(f"Dedup cache warmed with {len(self.__keys)} keys")
+
+    def lookup(self, events: list[EventModel]) -> set[tuple[str, str]]:
+        if not self.enabled:
+            return set()
+
+        known: set[tuple[str, str]] = set()
+
+        for event in events:
+            key: tuple[str, str] = (event.topic, event.event_id)
+
+            if key in self.__keys:
+                self.__keys.move_to_end(key)
+                known.add(key)
+                self.__hits += 1
+            else:
+                self.__misses += 1
+
+        return known
+
+    def add(self, keys: list[tuple[str, str]]) -> None:
+        if not self.enabled:
+            return
+
+        for key in keys:
+            self.__keys[key] = None
+            self.__keys.move_to_end(key)
+
+        while len(self.__keys) > self.__capacity:
+            _ = self.__keys.popitem(last=False)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.__keys),
+            "hits": self.__hits,
+            "misses": self.__misses,
+        }
@@ -0,0 +1,29 @@
+from collections import Counter
+
+
+class LaneScheduler:
+    def __init__(self, weights: dict[str, int], quantum: int) -> None:
+        self.__weights: dict[str, int] = weights
+        self.__quantum: int = max(1, quantum)
+        self.__deficits: dict[str, int] = {
+            lane: weight * self.__quantum for lane, weight in weights.items()
+        }
+
+    def order(self) -> list[str]:
+        return sorted(
+            self.__deficits,
+            key=lambda lane: (-self.__deficits[lane], -self.__weights[lane]),
+        )
+
+    def record(self, order: list[str], served: Counter[str]) -> None:
+        for lane in order:
+            if lane in served:
+                break
+            self.__deficits[lane] = 0
+
+        for lane, count in served.items():
+            self.__deficits[lane] -= count
+
+        if all(deficit <= 0 for deficit in self.__deficits.values()):
+            for lane, weight in self.__weights.items():
+                self.__deficits[lane] += weight * self.__quantum
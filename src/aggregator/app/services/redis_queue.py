@@ -1,17 +1,39 @@
-from datetime import datetime
+from collections import defaultdict
 from os import getenv
+from time import monotonic, perf_counter
 from typing import Any
+from zlib import crc32
 
 from loguru import logger
-from orjson import dumps, loads
+from orjson import dumps
+from pydantic import ValidationError
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 
-from ..models.events import EventModel
+from ..metrics import QUEUE_POP_SECONDS, QUEUE_PUSH_SECONDS
+from ..models.events import EventModel, QueuedEventModel
+
+PUSH_CHUNK_SIZE: int = 1000
+
+LIST_KEY: str = "events"
+STREAM_KEY: str = "events:stream"
+STREAM_GROUP: str = "chronicle"
+STREAM_FIELD: str = "event"
+DEFAULT_LANE: str = "default"
+DEAD_LETTER_KEY: str = "events:dead-letter"
 
 
 class RedisQueueService:
     __instance: "RedisQueueService | None" = None
     __client: Redis | None = None  # type: ignore[type-arg]
+    __backend: str = "list"
+    __partition_count: int = 1
+    __claim_idle_ms: int = 60000
+    __last_claim: dict[str, float] = {}
+    __lanes: dict[str, int] = {DEFAULT_LANE: 1}
+    __topic_lanes: dict[str, str] = {}
+    __default_lane: str = DEFAULT_LANE
+    __key_lanes: dict[str, str] = {}
 
     def __new__(cls) -> "RedisQueueService":
         if cls.__instance is None:
@@ -22,49 +44,478 @@ class RedisQueueService:
     async def initialize(self) -> None:
         redis_url: str = getenv(key="REDIS_URL", default="redis://localhost:6379/0")
 
+        self.__backend = getenv(key="QUEUE_BACKEND", default="list")
+        if self.__backend not in ("list", "stream"):
+            raise ValueError(f"Unsupported QUEUE_BACKEND: {self.__backend}")
+
+        self.__partition_count = max(
+            1, int(getenv(key="QUEUE_PARTITIONS", default="1"))
+        )
+        self.__claim_idle_ms = int(getenv(key="QUEUE_CLAIM_IDLE_MS", default="60000"))
+        self.__last_claim = {}
+
+        self.__lanes = {
+            lane: max(1, int(weight))
+            for lane, weight in self.__parse_pairs(
+                getenv(key="QUEUE_LANES", default=f"{DEFAULT_LANE}:1")
+            )
+        }
+        self.__default_lane = getenv(key="QUEUE_DEFAULT_LANE", default=DEFAULT_LANE)
+        self.__topic_lanes = dict(
+            self.__parse_pairs(getenv(key="QUEUE_TOPIC_LANES", default=""))
+        )
+
+        for lane in (self.__default_lane, *self.__topic_lanes.values()):
+            if lane not in self.__lanes:
+                raise ValueError(f"Unsupported queue lane: {lane}")
+
+        self.__key_lanes = {
+            self.__key(partition, lane): lane
+            for lane in self.__lanes
+            for partition in range(self.__partition_count)
+        }
+
         self.__client = Redis.from_url(url=redis_url, decode_responses=True)
 
         _ = await self.__client.ping()  # type: ignore[misc]
-        logger.info("Redis connection established")
+
+        if self.__backend == "stream":
+            await self.__create_groups(self.__keys(None))
+
+        logger.info(
+            f"Redis connection established ({self.__backend} backend, "
+            f"{self.__partition_count} partitions, lanes {self.__lanes})"
+        )
+
+    def __parse_pairs(self, value: str) -> list[tuple[str, str]]:
+        pairs: list[tuple[str, str]] = []
+
+        for item in value.split(","):
+            if not item.strip():
+                continue
+
+            name, separator, setting = item.strip().rpartition(":")
+            if not separator or not name or not setting:
+                raise ValueError(f"Unsupported queue lane setting: {item.strip()}")
+
+            pairs.append((name, setting))
+
+        return pairs
+
+    async def __create_groups(self, keys: list[str]) -> None:
+        if self.__client is None:
+            raise RuntimeError("Redis client not initialized")
+
+        for key in keys:
+            try:
+                _ = await self.__client.xgroup_create(
+                    name=key, groupname=STREAM_GROUP, id="0", mkstream=True
+                )
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    def get_partition_count(self) -> int:
+        return self.__partition_count
+
+    def get_lane_weights(self) -> dict[str, int]:
+        return dict(self.__lanes)
+
+    def lane(self, topic: str) -> str:
+        return self.__topic_lanes.get(topic, self.__default_lane)
+
+    def lane_of(self, message: QueuedEventModel) -> str:
+        return self.__key_lanes.get(message.queue, self.__default_lane)
+
+    def partition(self, topic: str) -> int:
+        if self.__partition_count == 1:
+            return 0
+
+        return crc32(topic.encode("utf-8")) % self.__partition_count
 
     async def push(self, event: EventModel) -> None:
+        await self.push_many([event])
+
+    async def push_many(self, events: list[EventModel]) -> None:
+        await self.push_raw(
+            [(event.topic, dumps(event.model_dump(mode="json"))) for event in events]
+        )
+
+    async def push_raw(self, events: list[tuple[str, bytes]]) -> None:
         if self.__client is None:
             raise RuntimeError("Redis client not initialized")
 
-        event_data: str = dumps(event.model_dump(mode="json")).decode("utf-8")
-        _ = await self.__client.lpush("events", event_data)  # type: ignore[misc]
+        if not events:
+            return
 
-    async def pop(self, timeout: int = 5) -> EventModel | None:
-        from ..models.events import EventPayloadModel
+        start_time: float = perf_counter()
 
+        partitioned: defaultdict[str, list[bytes]] = defaultdict(list)
+        for topic, data in events:
+            partitioned[self.__key(self.partition(topic), self.lane(topic))].append(
+                data
+            )
+
+        async with self.__client.pipeline(transaction=False) as pipeline:
+            for key, event_data in partitioned.items():
+                if self.__backend == "stream":
+                    for data in event_data:
+                        _ = pipeline.xadd(key, {STREAM_FIELD: data})
+                else:
+                    for i in range(0, len(event_data), PUSH_CHUNK_SIZE):
+                        _ = pipeline.lpush(key, *event_data[i : i + PUSH_CHUNK_SIZE])
+
+            _ = await pipeline.execute()
+
+        QUEUE_PUSH_SECONDS.observe(perf_counter() - start_time)
+
+    async def pop_many(
+        self,
+        consumer: str,
+        count: int,
+        timeout: int = 5,
+        linger_ms: int = 0,
+        partitions: list[int] | None = None,
+        lanes: list[str] | None = None,
+    ) -> list[QueuedEventModel]:
         if self.__client is None:
             raise RuntimeError("Redis client not initialized")
 
-        result: list[str] | None = await self.__client.brpop(  # type: ignore[misc]
-            keys=["events"], timeout=timeout
+        keys: list[str] = self.__keys(partitions, lanes)
+        start_time: float = perf_counter()
+
+        messages: list[QueuedEventModel] = (
+            await self.__read_stream(keys, consumer, count, timeout, linger_ms)
+            if self.__backend == "stream"
+            else await self.__pop_list(keys, count, timeout, linger_ms)
+        )
+
+        if messages:
+            QUEUE_POP_SECONDS.observe(perf_counter() - start_time)
+
+        return messages
+
+    async def ack(self, messages: list[QueuedEventModel]) -> None:
+        if self.__client is None:
+            raise RuntimeError("Redis client not initialized")
+
+        message_ids: defaultdict[str, list[str]] = defaultdict(list)
+        for message in messages:
+            if message.message_id:
+                message_ids[message.queue].append(message.message_id)
+
+        if not message_ids:
+            return
+
+        async with self.__client.pipeline(transaction=False) as pipeline:
+            for key, ids in message_ids.items():
+                _ = pipeline.xack(key, STREAM_GROUP, *ids)
+                _ = pipeline.xdel(key, *ids)
+
+            _ = await pipeline.execute()
+
+    async def dead_letter(self, messages: list[QueuedEventModel]) -> None:
+        entries: defaultdict[str, list[tuple[str | None, str]]] = defaultdict(list)
+        for message in messages:
+            entries[message.queue].append(
+                (
+                    message.message_id,
+                    dumps(message.event.model_dump(mode="json")).decode("utf-8"),
+                )
+            )
+
+        for key, queue_entries in entries.items():
+            await self.__dead_letter(key, queue_entries)
+
+    async def __pop_list(
+        self, keys: list[str], count: int, timeout: int, linger_ms: int
+    ) -> list[QueuedEventModel]:
+        if self.__client is None:
+            raise RuntimeError("Redis client not initialized")
+
+        result: list[Any] | None = await self.__client.blmpop(  # type: ignore[misc]
+            timeout, len(keys), *keys, direction="RIGHT", count=count
         )
 
         if result is None:
-            return None
+            return []
+
+        messages: list[QueuedEventModel] = await self.__list_messages(result)
+        deadline: float = monotonic() + linger_ms / 1000
 
-        event_data: dict[str, Any] = loads(result[1])
+        while len(messages) < count:
+            result = await self.__client.lmpop(  # type: ignore[misc]
+                len(keys), *keys, direction="RIGHT", count=count - len(messages)
+            )
 
-        payload_data: dict[str, Any] = event_data["payload"]
-        timestamp_str: str = str(event_data["timestamp"])
+            if result is not None:
+                messages.extend(await self.__list_messages(result))
+                continue
+
+            remaining: float = deadline - monotonic()
+            if remaining <= 0:
+                break
+
+            result = await self.__client.blmpop(  # type: ignore[misc]
+                remaining,
+                len(keys),
+                *keys,
+                direction="RIGHT",
+                count=count - len(messages),
+            )
+
+            if result is None:
+                break
+
+            messages.extend(await self.__list_messages(result))
+
+        return messages
+
+    async def __list_messages(self, result: list[Any]) -> list[QueuedEventModel]:
+        return await self.__decode(
+            result[0], [(None, raw_event) for raw_event in result[1]]
+        )
 
-        return EventModel(
-            event_id=str(event_data["event_id"]),
-            topic=str(event_data["topic"]),
-            source=str(event_data["source"]),
-            payload=EventPayloadModel.model_validate(payload_data),
-            timestamp=datetime.fromisoformat(timestamp_str),
+    async def __read_stream(
+        self,
+        keys: list[str],
+        consumer: str,
+        count: int,
+        timeout: int,
+        linger_ms: int,
+    ) -> list[QueuedEventModel]:
+        messages: list[QueuedEventModel] = await self.__claim_stale(
+            keys, consumer, count
         )
+        if messages:
+            return messages
 
-    async def length(self) -> int:
+        messages = await self.__xreadgroup(
+            keys, consumer, count, block_ms=timeout * 1000
+        )
+
+        if not messages:
+            return []
+
+        deadline: float = monotonic() + linger_ms / 1000
+
+        while len(messages) < count:
+            items: list[QueuedEventModel] = await self.__xreadgroup(
+                keys, consumer, count - len(messages), block_ms=None
+            )
+
+            if items:
+                messages.extend(items)
+                continue
+
+            remaining: float = deadline - monotonic()
+            if remaining <= 0:
+                break
+
+            items = await self.__xreadgroup(
+                keys,
+                consumer,
+                count - len(messages),
+                block_ms=max(1, int(remaining * 1000)),
+            )
+
+            if not items:
+                break
+
+            messages.extend(items)
+
+        return messages
+
+    async def __xreadgroup(
+        self, keys: list[str], consumer: str, count: int, block_ms: int | None
+    ) -> list[QueuedEventModel]:
+        messages: list[QueuedEventModel] = []
+
+        for key in keys:
+            if len(messages) >= count:
+                break
+
+            messages.extend(
+                await self.__xreadgroup_streams(
+                    [key], consumer, count - len(messages), block_ms=None
+                )
+            )
+
+        if messages or block_ms is None:
+            return messages
+
+        return await self.__xreadgroup_streams(
+            keys, consumer, max(1, count // len(keys)), block_ms=block_ms
+        )
+
+    async def __xreadgroup_streams(
+        self, keys: list[str], consumer: str, count: int, block_ms: int | None
+    ) -> list[QueuedEventModel]:
+        if self.__client is None:
+            raise RuntimeError("Redis client not initialized")
+
+        try:
+            response: list[Any] | dict[Any, Any] = await self.__client.xreadgroup(
+                groupname=STREAM_GROUP,
+                consumername=consumer,
+                streams=dict.fromkeys(keys, ">"),
+                count=count,
+                block=block_ms,
+            )
+        except ResponseError as e:
+            if "NOGROUP" not in str(e):
+                raise
+
+            logger.warning(f"Consumer {consumer}: Recreating missing stream group")
+            await self.__create_groups(keys)
+            return []
+
+        messages: list[QueuedEventModel] = []
+        for key, entries in (
+            response.items() if isinstance(response, dict) else response
+        ):
+            messages.extend(await self.__stream_messages(key, entries))
+
+        return messages
+
+    async def __claim_stale(
+        self, keys: list[str], consumer: str, count: int
+    ) -> list[QueuedEventModel]:
+        if self.__client is None:
+            raise RuntimeError("Redis client not initialized")
+
+        now: float = monotonic()
+        if now - self.__last_claim.get(consumer, 0.0) < self.__claim_idle_ms / 1000:
+            return []
+
+        self.__last_claim[consumer] = now
+
+        messages: list[QueuedEventModel] = []
+        for key in keys:
+            try:
+                response: list[Any] = await self.__client.xautoclaim(
+                    name=key,
+                    groupname=STREAM_GROUP,
+                    consumername=consumer,
+                    min_idle_time=self.__claim_idle_ms,
+                    count=count,
+                )
+            except ResponseError as e:
+                if "NOGROUP" not in str(e):
+                    raise
+
+                await self.__create_groups([key])
+                continue
+
+            messages.extend(await self.__stream_messages(key, response[1]))
+
+        if messages:
+            logger.warning(
+                f"Consumer {consumer}: Claimed {len(messages)} stale stream entries"
+            )
+
+        return messages
+
+    async def __stream_messages(
+        self, key: str, entries: list[tuple[str, dict[str, str] | None]]
+    ) -> list[QueuedEventModel]:
+        return await self.__decode(
+            key,
+            [
+                (message_id, fields[STREAM_FIELD])
+                for message_id, fields in entries
+                if fields
+            ],
+        )
+
+    async def __decode(
+        self, key: str, entries: list[tuple[str | None, str]]
+    ) -> list[QueuedEventModel]:
+        messages: list[QueuedEventModel] = []
+        dead: list[tuple[str | None, str]] = []
+
+        for message_id, raw_event in entries:
+            try:
+                event: EventModel = EventModel.model_validate_json(raw_event)
+            except ValidationError as e:
+                logger.error(
+                    f"Queue {key}: Dead-lettering unparseable message "
+                    f"{message_id or raw_event[:200]} - {e}"
+                )
+                dead.append((message_id, raw_event))
+                continue
+
+            messages.append(
+                QueuedEventModel(queue=key, message_id=message_id, event=event)
+            )
+
+        if dead:
+            await self.__dead_letter(key, dead)
+
+        return messages
+
+    async def __dead_letter(
+        self, key: str, entries: list[tuple[str | None, str]]
+    ) -> None:
         if self.__client is None:
             raise RuntimeError("Redis client not initialized")
 
-        return await self.__client.llen("events")  # type: ignore[return-value]
+        message_ids: list[str] = [
+            message_id for message_id, _ in entries if message_id is not None
+        ]
+
+        async with self.__client.pipeline(transaction=False) as pipeline:
+            _ = pipeline.lpush(
+                DEAD_LETTER_KEY, *(raw_event for _, raw_event in entries)
+            )
+
+            if message_ids:
+                _ = pipeline.xack(key, STREAM_GROUP, *message_ids)
+                _ = pipeline.xdel(key, *message_ids)
+
+            _ = await pipeline.execute()
+
+    def __key(self, partition: int, lane: str) -> str:
+        key: str = STREAM_KEY if self.__backend == "stream" else LIST_KEY
+
+        if len(self.__lanes) > 1:
+            key = f"{key}:{lane}"
+
+        if self.__partition_count > 1:
+            key = f"{key}:{partition}"
+
+        return key
+
+    def __keys(
+        self, partitions: list[int] | None, lanes: list[str] | None = None
+    ) -> list[str]:
+        if partitions is None:
+            partitions = list(range(self.__partition_count))
+
+        if lanes is None:
+            lanes = list(self.__lanes)
+
+        return [
+            self.__key(partition, lane) for lane in lanes for partition in partitions
+        ]
+
+    async def length(self, partition: int | None = None) -> int:
+        if self.__client is None:
+            raise RuntimeError("Redis client not initialized")
+
+        keys: list[str] = self.__keys(None if partition is None else [partition])
+
+        async with self.__client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                _ = (
+                    pipeline.xlen(key)
+                    if self.__backend == "stream"
+                    else pipeline.llen(key)
+                )
+
+            lengths: list[int] = await pipeline.execute()
+
+        return sum(lengths)
 
     async def close(self) -> None:
         if self.__client:
@@ -1,37 +1,54 @@
-from asyncio import run, sleep
+from argparse import ArgumentParser, Namespace
+from asyncio import Task, create_task, gather, run, sleep
+from collections.abc import Iterator
 from datetime import datetime
-from http.client import HTTPResponse
+from gzip import compress
+from mmap import ACCESS_READ, mmap
 from os import getenv
-from time import time
+from statistics import quantiles
+from time import perf_counter
 from typing import TypeAlias
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
+from zlib import crc32
 
+from httpx import AsyncClient, HTTPError, Limits, Response
 from loguru import logger
 from orjson import dumps
 
 EventData: TypeAlias = dict[str, str | dict[str, str]]
-RequestData: TypeAlias = dict[str, list[EventData]]
+EncodedBatch: TypeAlias = tuple[int, int, bytes]
 
+EVENT_TEMPLATE: bytes = (
+    b'{"event_id":"publisher-event-%d","topic":"topic-%d",'
+    b'"source":"publisher-service",'
+    b'"payload":{"message":"Message from publisher %d","timestamp":"%s"},'
+    b'"timestamp":"%s"}'
+)
 
-def make_request_with_retry(
-    url: str, data: RequestData, max_retries: int = 5
+
+async def make_request_with_retry(
+    client: AsyncClient,
+    url: str,
+    body: bytes,
+    headers: dict[str, str],
+    max_retries: int = 5,
 ) -> tuple[int | None, str | None]:
     for attempt in range(max_retries):
         try:
-            request: Request = Request(
-                url, data=dumps(data), headers={"Content-Type": "application/json"}
-            )
+            response: Response = await client.post(url, content=body, headers=headers)
 
-            response: HTTPResponse = urlopen(url=request, timeout=30)
-            with response:
-                status_code: int = response.getcode()
-                response_text: str = response.read().decode(encoding="utf-8")
+            if response.status_code == 429 and attempt < max_retries - 1:
+                retry_after: float = float(
+                    response.headers.get("Retry-After", min(2 ** (attempt + 1), 30))
+                )
+                logger.warning(
+                    f"Aggregator overloaded (attempt {attempt + 1}/{max_retries}), "
+                    f"retrying in {retry_after}s"
+                )
+                await sleep(delay=retry_after)
+                continue
 
-                return status_code, response_text
+            return response.status_code, response.text
         except HTTPError as e:
-            return e.code, e.read().decode("utf-8")
-        except Exception as e:
             backoff_time: float = min(2 ** (attempt + 1), 30)
             logger.warning(
                 f"Request failed (attempt {attempt + 1}/{max_retries}): {e}, "
@@ -39,99 +56,298 @@ def make_request_with_retry(
             )
 
             if attempt < max_retries - 1:
-                from time import sleep as sync_sleep
-
-                sync_sleep(backoff_time)
+                await sleep(delay=backoff_time)
 
     logger.error(f"All {max_retries} attempts failed")
     return None, None
 
 
+def generate_event_indices(
+    count: int, duplicate_ratio: float
+) -> Iterator[tuple[int, int, bool]]:
+    unique_count: int = 0
+
+    for i in range(count):
+        is_duplicate: bool = unique_count > 0 and int((i + 1) * duplicate_ratio) > int(
+            i * duplicate_ratio
+        )
+
+        if is_duplicate:
+            yield i, crc32(str(i).encode("utf-8")) % unique_count, True
+        else:
+            yield i, unique_count, False
+            unique_count += 1
+
+
 def generate_test_events(
     count: int = 20000, duplicate_ratio: float = 0.3
-) -> list[EventData]:
-    events: list[EventData] = []
-    unique_count: int = int(count * (1 - duplicate_ratio))
-    duplicate_count: int = count - unique_count
-
-    for i in range(unique_count):
-        events.append(
-            {
-                "event_id": f"publisher-event-{i}",
-                "topic": f"topic-{i % 5}",
-                "source": "publisher-service",
-                "payload": {
-                    "message": f"Message from publisher {i}",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                "timestamp": datetime.now().isoformat(),
-            }
+) -> Iterator[EventData]:
+    for i, event_index, is_duplicate in generate_event_indices(count, duplicate_ratio):
+        timestamp: str = datetime.now().isoformat()
+        message: str = (
+            f"Duplicate message {i}"
+            if is_duplicate
+            else f"Message from publisher {event_index}"
         )
 
-    for i in range(duplicate_count):
-        if events:
-            original: EventData = events[i % len(events)]
-            events.append(
-                {
-                    "event_id": original["event_id"],
-                    "topic": original["topic"],
-                    "source": original["source"],
-                    "payload": {
-                        "message": f"Duplicate message {i}",
-                        "timestamp": datetime.now().isoformat(),
-                    },
-                    "timestamp": datetime.now().isoformat(),
-                }
-            )
+        yield {
+            "event_id": f"publisher-event-{event_index}",
+            "topic": f"topic-{event_index % 5}",
+            "source": "publisher-service",
+            "payload": {"message": message, "timestamp": timestamp},
+            "timestamp": timestamp,
+        }
+
+
+def generate_batches(
+    count: int, duplicate_ratio: float, batch_size: int
+) -> Iterator[EncodedBatch]:
+    events: Iterator[EventData] = generate_test_events(count, duplicate_ratio)
+    batch_number: int = 0
+
+    while batch := [event for _, event in zip(range(batch_size), events)]:
+        batch_number += 1
+        yield batch_number, len(batch), dumps({"events": batch})
+
+
+def generate_template_batches(
+    count: int, duplicate_ratio: float, batch_size: int
+) -> Iterator[EncodedBatch]:
+    timestamp: bytes = datetime.now().isoformat().encode("utf-8")
+    indices: Iterator[tuple[int, int, bool]] = generate_event_indices(
+        count, duplicate_ratio
+    )
+    batch_number: int = 0
+
+    while batch := [
+        EVENT_TEMPLATE
+        % (event_index, event_index % 5, event_index, timestamp, timestamp)
+        for _, (_, event_index, _) in zip(range(batch_size), indices)
+    ]:
+        batch_number += 1
+        yield batch_number, len(batch), b'{"events":[' + b",".join(batch) + b"]}"
+
+
+def replay_batches(path: str) -> Iterator[EncodedBatch]:
+    with open(path, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+        batch_number: int = 0
+        position: int = 0
+
+        while position < len(data):
+            end: int = data.find(b"\n", position)
+            if end == -1:
+                end = len(data)
+
+            body: bytes = data[position:end]
+            position = end + 1
+
+            if not body.strip():
+                continue
+
+            batch_number += 1
+            yield batch_number, body.count(b'"event_id"'), body
+
+
+def record_batches(path: str, batches: Iterator[EncodedBatch]) -> None:
+    batch_count: int = 0
+    event_count: int = 0
+
+    with open(path, "wb") as file:
+        for _, count, body in batches:
+            _ = file.write(body)
+            _ = file.write(b"\n")
+            batch_count += 1
+            event_count += count
+
+    logger.info(f"Recorded {event_count} events in {batch_count} batches to {path}")
+
+
+class PublishReport:
+    def __init__(self) -> None:
+        self.total_sent: int = 0
+        self.total_events: int = 0
+        self.failed_batches: int = 0
+        self.latencies: list[float] = []
+
+
+async def publish_batch(
+    client: AsyncClient,
+    url: str,
+    batch: EncodedBatch,
+    report: PublishReport,
+    use_gzip: bool,
+    scheduled_time: float | None = None,
+) -> None:
+    batch_number, count, body = batch
+    headers: dict[str, str] = {"Content-Type": "application/json"}
+
+    if use_gzip:
+        body = compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
 
-    return events
+    report.total_events += count
+
+    start_time: float = perf_counter() if scheduled_time is None else scheduled_time
+    status, response = await make_request_with_retry(client, url, body, headers)
+    latency: float = perf_counter() - start_time
+
+    if status == 200:
+        report.total_sent += count
+        report.latencies.append(latency)
+        logger.info(
+            f"Batch {batch_number}: Sent {count} events in {latency * 1000:.1f}ms"
+        )
+    else:
+        report.failed_batches += 1
+        logger.error(f"Batch {batch_number} failed: {response}")
+
+
+async def publish_worker(
+    client: AsyncClient,
+    url: str,
+    batches: Iterator[EncodedBatch],
+    report: PublishReport,
+    use_gzip: bool,
+) -> None:
+    for batch in batches:
+        await publish_batch(client, url, batch, report, use_gzip)
+
+
+async def publish_at_rate(
+    client: AsyncClient,
+    url: str,
+    batches: Iterator[EncodedBatch],
+    report: PublishReport,
+    use_gzip: bool,
+    rate: float,
+) -> None:
+    tasks: set[Task[None]] = set()
+    start_time: float = perf_counter()
+    scheduled_events: int = 0
+
+    for batch in batches:
+        scheduled_time: float = start_time + scheduled_events / rate
+        scheduled_events += batch[1]
+
+        delay: float = scheduled_time - perf_counter()
+        if delay > 0:
+            await sleep(delay=delay)
+
+        task: Task[None] = create_task(
+            coro=publish_batch(client, url, batch, report, use_gzip, scheduled_time)
+        )
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    _ = await gather(*tasks)
+
+
+def parse_args() -> Namespace:
+    parser: ArgumentParser = ArgumentParser(description="ChronicleWeaver publisher")
+    _ = parser.add_argument(
+        "--events",
+        type=int,
+        default=int(getenv("EVENT_COUNT", default="20000")),
+        help="total events to publish",
+    )
+    _ = parser.add_argument(
+        "--rate",
+        type=float,
+        default=float(getenv("PUBLISHER_RATE", default="0")),
+        help="target events/s in open-loop mode (0 sends as fast as possible)",
+    )
+    _ = parser.add_argument(
+        "--template",
+        action="store_true",
+        default=getenv("PUBLISHER_TEMPLATE", default="false").lower() == "true",
+        help="encode events from a fixed byte template with patched-in ids",
+    )
+    _ = parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="write the encoded batches to FILE as NDJSON instead of sending them",
+    )
+    _ = parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="send pre-encoded NDJSON batches from FILE (one request body per line)",
+    )
+
+    return parser.parse_args()
 
 
 async def main() -> None:
+    args: Namespace = parse_args()
+
     aggregator_url: str = getenv("AGGREGATOR_URL", default="http://localhost:8080")
-    event_count: int = int(getenv("EVENT_COUNT", default="20000"))
+    event_count: int = args.events
+    rate: float = args.rate
     duplicate_ratio: float = float(getenv("DUPLICATE_RATIO", default="0.3"))
     batch_size: int = int(getenv("BATCH_SIZE", default="1000"))
+    concurrency: int = int(getenv("PUBLISHER_CONCURRENCY", default="4"))
+    use_gzip: bool = getenv("PUBLISHER_GZIP", default="false").lower() == "true"
 
     url: str = f"{aggregator_url}/publish"
 
-    logger.info(
-        f"Publisher starting stress test: {event_count} events, "
-        f"{duplicate_ratio * 100:.0f}% duplicates, batch size {batch_size}"
-    )
+    batches: Iterator[EncodedBatch]
+    if args.replay:
+        batches = replay_batches(args.replay)
+    elif args.template:
+        batches = generate_template_batches(event_count, duplicate_ratio, batch_size)
+    else:
+        batches = generate_batches(event_count, duplicate_ratio, batch_size)
 
-    events: list[EventData] = generate_test_events(
-        count=event_count, duplicate_ratio=duplicate_ratio
-    )
+    if args.record:
+        record_batches(args.record, batches)
+        return
 
-    start_time: float = time()
-    total_sent: int = 0
-    failed_batches: int = 0
+    logger.info(
+        f"Publisher starting stress test: "
+        f"{f'replay of {args.replay}' if args.replay else f'{event_count} events'}, "
+        f"{duplicate_ratio * 100:.0f}% duplicates, batch size {batch_size}, "
+        f"concurrency {concurrency}, gzip {use_gzip}, "
+        f"rate {f'{rate:.0f} events/s' if rate > 0 else 'unlimited'}"
+    )
 
-    for i in range(0, len(events), batch_size):
-        batch: list[EventData] = events[i : i + batch_size]
-        data: RequestData = {"events": batch}
+    report: PublishReport = PublishReport()
 
-        status, response = make_request_with_retry(url, data)
+    start_time: float = perf_counter()
 
-        if status == 200:
-            total_sent += len(batch)
-            logger.info(f"Batch {i // batch_size + 1}: Sent {len(batch)} events")
+    async with AsyncClient(
+        timeout=30,
+        limits=Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        ),
+    ) as client:
+        if rate > 0:
+            await publish_at_rate(client, url, batches, report, use_gzip, rate)
         else:
-            failed_batches += 1
-            logger.error(f"Batch {i // batch_size + 1} failed: {response}")
-
-        await sleep(0.1)
+            _ = await gather(
+                *(
+                    publish_worker(client, url, batches, report, use_gzip)
+                    for _ in range(concurrency)
+                )
+            )
 
-    elapsed_time: float = time() - start_time
-    throughput: float = total_sent / elapsed_time if elapsed_time > 0 else 0
+    elapsed_time: float = perf_counter() - start_time
+    throughput: float = report.total_sent / elapsed_time if elapsed_time > 0 else 0
 
     logger.info(
         f"Stress test completed: "
-        f"sent {total_sent}/{len(events)} events in {elapsed_time:.2f}s "
-        f"({throughput:.2f} events/s), {failed_batches} failed batches"
+        f"sent {report.total_sent}/{report.total_events} events in {elapsed_time:.2f}s "
+        f"({throughput:.2f} events/s), {report.failed_batches} failed batches"
     )
 
+    if len(report.latencies) >= 2:
+        percentiles: list[float] = quantiles(
+            report.latencies, n=100, method="inclusive"
+        )
+        logger.info(
+            f"Batch latency: p50 {percentiles[49] * 1000:.1f}ms, "
+            f"p90 {percentiles[89] * 1000:.1f}ms, p99 {percentiles[98] * 1000:.1f}ms, "
+            f"max {max(report.latencies) * 1000:.1f}ms"
+        )
+
 
 if __name__ == "__main__":
     run(main=main())
@@ -1,4 +1,11 @@
-from utils.testing import create_events, get_events, get_stats, publish_events
+from orjson import loads
+from utils.testing import (
+    create_events,
+    get_events,
+    get_request,
+    get_stats,
+    publish_events,
+)
 
 
 def test_events_structure(server_url: str) -> None:
@@ -47,3 +54,45 @@ def test_events_unique_ids(server_url: str) -> None:
         key = (event["event_id"], event["topic"])
         assert key not in event_keys
         event_keys.add(key)
+
+
+def test_events_keyset_pagination(server_url: str) -> None:
+    topic = "pagination-topic"
+    events = create_events(count=25, topic=topic, prefix="pagination-event")
+
+    publish_events(server_url, events, wait_seconds=2)
+
+    seen_ids: list[str] = []
+    url = f"{server_url}/events?topic={topic}&limit=10"
+    next_cursor: str | None = None
+
+    for _ in range(5):
+        page_url = f"{url}&after={next_cursor}" if next_cursor else url
+        status, response = get_request(page_url)
+        assert status == 200
+
+        page = loads(response or "{}")
+        assert page["count"] <= 10
+        seen_ids.extend(e["event_id"] for e in page["events"])
+
+        next_cursor = page["next_cursor"]
+        if next_cursor is None:
+            break
+
+    assert next_cursor is None
+    assert len(seen_ids) == 25
+    assert set(seen_ids) == {f"pagination-event-{i}" for i in range(25)}
+
+
+def test_events_invalid_cursor(server_url: str) -> None:
+    status, _ = get_request(f"{server_url}/events?limit=10&after=not-a-cursor")
+    assert status == 400
+
+
+def test_events_stream_ndjson(server_url: str) -> None:
+    status, response = get_request(f"{server_url}/events/stream?topic=pagination-topic")
+    assert status == 200
+
+    lines = [loads(line) for line in (response or "").splitlines() if line]
+    assert len(lines) == 25
+    assert all(line["topic"] == "pagination-topic" for line in lines)
@@ -71,3 +71,56 @@ def test_edge_case_very_long_event_id(server_url: str) -> None:
     }
     status, _ = post_request(url, {"events": [event]})
     assert status == 200
+
+
+def test_edge_case_gzip_request_body(server_url: str) -> None:
+    url = f"{server_url}/publish"
+    event = {
+        "event_id": "gzip-body-001",
+        "topic": "gzip-topic",
+        "source": "test-service",
+        "payload": {"message": "Gzip body test", "timestamp": "2025-01-01T00:00:00"},
+        "timestamp": "2025-01-01T00:00:00",
+    }
+    status, _ = post_request(url, {"events": [event]}, use_gzip=True)
+    assert status == 200
+
+    from time import sleep
+
+    sleep(2)
+
+    status, events_data = get_events(server_url, topic="gzip-topic")
+    assert status == 200
+    assert any(e["event_id"] == "gzip-body-001" for e in events_data["events"])
+
+
+def test_edge_case_nul_event_id_does_not_drop_batch(server_url: str) -> None:
+    url = f"{server_url}/publish"
+    events = [
+        {
+            "event_id": f"nul-batch-{i:03d}" + ("\x00" if i == 2 else ""),
+            "topic": "nul-batch-topic",
+            "source": "test-service",
+            "payload": {
+                "message": "NUL batch test",
+                "timestamp": "2025-01-01T00:00:00",
+            },
+            "timestamp": "2025-01-01T00:00:00",
+        }
+        for i in range(5)
+    ]
+    status, _ = post_request(url, {"events": events})
+    assert status == 200
+
+    from time import sleep
+
+    sleep(3)
+
+    status, events_data = get_events(server_url, topic="nul-batch-topic")
+    assert status == 200
+    assert sorted(e["event_id"] for e in events_data["events"]) == [
+        "nul-batch-000",
+        "nul-batch-001",
+        "nul-batch-003",
+        "nul-batch-004",
+    ]
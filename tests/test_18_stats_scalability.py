@@ -0,0 +1,57 @@
+from orjson import loads
+from src.aggregator.app.services.database import STATS_QUERY
+from utils.testing import execute_sql, get_request, get_stats
+
+BULK_ROWS = 2_000_000
+
+
+def _bulk_load_processed_events(count: int) -> None:
+    output = execute_sql(
+        f"""
+        INSERT INTO processed_events (event_id, topic, source, payload, timestamp)
+        SELECT
+            'bulk-event-' || i,
+            'bulk-topic-' || (i % 10),
+            'bulk-loader',
+            '{{"message": "Bulk message", "timestamp": "2025-01-01T00:00:00"}}',
+            NOW()
+        FROM generate_series(1, {count}) AS i;
+
+        INSERT INTO topics (topic)
+        SELECT 'bulk-topic-' || i FROM generate_series(0, 9) AS i
+        ON CONFLICT (topic) DO NOTHING;
+
+        UPDATE stats
+        SET received = received + {count}, unique_processed = unique_processed + {count}
+        WHERE id = 1;
+        """,
+        timeout=600,
+    )
+    assert output is not None, "Failed to bulk load processed_events"
+
+
+def _execution_time_ms(query: str) -> float:
+    output = execute_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {query}")
+    assert output is not None
+    return float(loads(output)[0]["Execution Time"])
+
+
+def test_stats_counters_after_bulk_load(server_url: str) -> None:
+    _bulk_load_processed_events(BULK_ROWS)
+
+    status, stats = get_stats(server_url)
+    assert status == 200
+    assert stats["unique_processed"] == BULK_ROWS
+    assert stats["received"] == stats["unique_processed"] + stats["duplicated_dropped"]
+    assert {f"bulk-topic-{i}" for i in range(10)} <= set(stats["topics"])
+
+
+def test_stats_query_is_sub_millisecond(server_url: str) -> None:
+    timings = sorted(_execution_time_ms(STATS_QUERY) for _ in range(5))
+    assert timings[len(timings) // 2] < 1.0
+
+
+def test_ready_endpoint_with_large_table(server_url: str) -> None:
+    status, response = get_request(f"{server_url}/ready")
+    assert status == 200
+    assert loads(response or "{}")["status"] == "ready"
@@ -0,0 +1,54 @@
+from time import sleep, time
+
+from utils.testing import (
+    create_events,
+    get_events,
+    get_stats,
+    kill_aggregator_container,
+    post_request,
+)
+
+
+def wait_for_topic_count(
+    server_url: str, topic: str, expected_count: int, timeout: int = 90
+) -> int:
+    start = time()
+    actual_count = 0
+    while time() - start < timeout:
+        status, events_data = get_events(server_url, topic=topic)
+        if status == 200:
+            actual_count = events_data["count"]
+            if actual_count >= expected_count:
+                return actual_count
+        sleep(2)
+    return actual_count
+
+
+def test_no_loss_after_forced_worker_kill(server_url: str) -> None:
+    topic = "redelivery-topic"
+    events = create_events(count=5000, topic=topic, prefix="redelivery-event")
+
+    for i in range(0, len(events), 1000):
+        status, _ = post_request(
+            f"{server_url}/publish", {"events": events[i : i + 1000]}
+        )
+        assert status == 200
+
+    killed = kill_aggregator_container()
+    assert killed, "Failed to kill and restart aggregator container"
+
+    actual_count = wait_for_topic_count(server_url, topic, 5000)
+    assert actual_count == 5000
+
+    status, events_data = get_events(server_url, topic=topic)
+    assert status == 200
+    assert {e["event_id"] for e in events_data["events"]} == {
+        f"redelivery-event-{i}" for i in range(5000)
+    }
+
+
+def test_stats_consistent_after_redelivery(server_url: str) -> None:
+    status, stats = get_stats(server_url)
+    assert status == 200
+    assert stats["unique_processed"] == 5000
+    assert stats["received"] == stats["unique_processed"] + stats["duplicated_dropped"]
@@ -0,0 +1,39 @@
+from time import sleep
+
+from orjson import dumps, loads
+from utils.testing import create_event, create_events, get_events, post_ndjson_request
+
+
+def test_ndjson_publish_stores_events(server_url: str) -> None:
+    url = f"{server_url}/publish/ndjson"
+    events = create_events(count=100, topic="ndjson-topic", prefix="ndjson-event")
+    duplicate = create_event(event_id="ndjson-event-0", topic="ndjson-topic")
+
+    status, response = post_ndjson_request(
+        url, [dumps(event) for event in [*events, duplicate]]
+    )
+    assert status == 200
+    assert loads(response or "{}")["events_count"] == 101
+
+    sleep(3)
+
+    status, events_data = get_events(server_url, topic="ndjson-topic")
+    assert status == 200
+    assert events_data["count"] == 100
+
+
+def test_ndjson_publish_rejects_invalid_line(server_url: str) -> None:
+    url = f"{server_url}/publish/ndjson"
+    valid = create_event(event_id="ndjson-invalid-001", topic="ndjson-invalid-topic")
+
+    status, response = post_ndjson_request(
+        url, [dumps(valid), b'{"event_id": "missing-fields"}']
+    )
+    assert status == 422
+    assert "line 2" in loads(response or "{}")["detail"]
+
+    sleep(2)
+
+    status, events_data = get_events(server_url, topic="ndjson-invalid-topic")
+    assert status == 200
+    assert events_data["count"] == 0
@@ -0,0 +1,53 @@
+from orjson import loads
+from utils.testing import (
+    create_events,
+    execute_sql,
+    get_request,
+    publish_events,
+)
+
+ACTION_FIELDS = {
+    "RECEIVED": "received",
+    "QUEUED": "queued",
+    "PROCESSED": "processed",
+    "DROPPED": "dropped",
+    "FAILED": "failed",
+}
+
+
+def _full_scan(sql: str) -> list[list[str]]:
+    output = execute_sql(sql)
+    assert output is not None, "Failed to scan audit_log"
+    return [line.split("|") for line in output.splitlines() if line]
+
+
+def test_audit_summary_matches_full_scan(server_url: str) -> None:
+    events = create_events(count=200, topic="rollup-topic-a", prefix="rollup-event")
+    events += create_events(count=100, topic="rollup-topic-b", prefix="rollup-event")
+
+    publish_events(server_url, events, wait_seconds=2)
+    publish_events(server_url, events[:150], wait_seconds=5)
+
+    status, response = get_request(f"{server_url}/audit/summary")
+    assert status == 200
+    summary = loads(response or "{}")
+
+    for action, count in _full_scan(
+        "SELECT action, COUNT(*) FROM audit_log GROUP BY action"
+    ):
+        assert summary[f"total_{ACTION_FIELDS[action]}"] == int(count)
+
+    for topic, action, count in _full_scan(
+        "SELECT topic, action, COUNT(*) FROM audit_log GROUP BY topic, action"
+    ):
+        assert summary["by_topic"][topic][ACTION_FIELDS[action]] == int(count)
+
+    for worker_id, action, count in _full_scan(
+        "SELECT worker_id, action, COUNT(*) FROM audit_log "
+        "WHERE worker_id IS NOT NULL GROUP BY worker_id, action"
+    ):
+        assert summary["by_worker"][worker_id][ACTION_FIELDS[action]] == int(count)
+
+    assert summary["total_received"] == 450
+    assert summary["total_processed"] == 300
+    assert summary["total_dropped"] == 150
@@ -0,0 +1,45 @@
+from datetime import UTC, datetime, timedelta
+
+from utils.testing import create_event, execute_sql, publish_events
+
+
+def test_audit_log_is_partitioned(server_url: str) -> None:
+    relkind = execute_sql("SELECT relkind FROM pg_class WHERE relname = 'audit_log'")
+    assert relkind is not None
+    assert relkind.strip() == "p"
+
+    partitions = execute_sql(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'audit_log'::regclass"
+    )
+    assert partitions is not None
+    assert "audit_log_default" in partitions.split()
+    assert f"audit_log_p{datetime.now(UTC):%Y%m%d}" in partitions.split()
+
+
+def test_audit_rows_land_in_current_partition(server_url: str) -> None:
+    event = create_event(event_id="partition-event-001", topic="partition-topic")
+    publish_events(server_url, [event], wait_seconds=3)
+
+    partitions = execute_sql(
+        "SELECT DISTINCT tableoid::regclass FROM audit_log "
+        "WHERE event_id = 'partition-event-001'"
+    )
+    assert partitions is not None
+    assert partitions.split() == [f"audit_log_p{datetime.now(UTC):%Y%m%d}"]
+
+
+def test_audit_time_range_prunes_partitions(server_url: str) -> None:
+    now = datetime.now(UTC)
+    start = max(now - timedelta(minutes=5), now.replace(hour=0, minute=0, second=0))
+
+    plan = execute_sql(
+        "EXPLAIN SELECT * FROM audit_log "
+        f"WHERE created_at >= '{start.isoformat()}' AND created_at <= '{now.isoformat()}' "
+        "ORDER BY created_at DESC LIMIT 100"
+    )
+    assert plan is not None
+    assert f"audit_log_p{now:%Y%m%d}" in plan
+    assert "audit_log_default" not in plan
+    assert f"audit_log_p{now + timedelta(days=1):%Y%m%d}" not in plan
@@ -0,0 +1,110 @@
+from re import findall
+
+from orjson import loads
+from src.aggregator.app.services.database import build_audit_query
+from utils.testing import create_event, execute_sql, get_request, publish_events
+
+AUDIT_FILTER_VALUES: dict[str, str] = {
+    "action": "'PROCESSED'",
+    "topic": "'audit-index-topic-1'",
+    "event_id": "'audit-index-event-1'",
+    "from_time": "NOW() - INTERVAL '1 hour'",
+    "to_time": "NOW()",
+}
+INDEX_EVENTS = 100_000
+
+
+def _seed_audit_log(count: int) -> None:
+    output = execute_sql(
+        f"""
+        INSERT INTO audit_log (event_id, topic, source, action, worker_id, created_at)
+        SELECT
+            'audit-index-event-' || (i / 3),
+            'audit-index-topic-' || ((i / 3) % 50),
+            'audit-index-loader',
+            (ARRAY['RECEIVED', 'QUEUED', 'PROCESSED'])[i % 3 + 1],
+            (i / 3) % 4,
+            NOW() - i * INTERVAL '1 millisecond'
+        FROM generate_series(0, {count * 3 - 1}) AS i;
+
+        ANALYZE audit_log;
+        """,
+        timeout=300,
+    )
+    assert output is not None, "Failed to seed audit_log"
+
+
+def test_audit_keyset_pagination(server_url: str) -> None:
+    events = [
+        create_event(event_id=f"audit-page-{i:03d}", topic="audit-page-topic")
+        for i in range(25)
+    ]
+    publish_events(server_url, events, wait_seconds=3)
+
+    seen: list[int] = []
+    after: str | None = None
+
+    while True:
+        url = f"{server_url}/audit?topic=audit-page-topic&limit=10"
+        if after:
+            url += f"&after={after}"
+
+        status, response = get_request(url)
+        assert status == 200
+
+        page = loads(response or "{}")
+        seen.extend(log["id"] for log in page["audit_logs"])
+
+        after = page["next_cursor"]
+        if after is None:
+            break
+
+    assert len(seen) == 75
+    assert len(set(seen)) == len(seen)
+
+
+def test_audit_invalid_cursor(server_url: str) -> None:
+    status, _ = get_request(f"{server_url}/audit?after=not-a-cursor")
+    assert status == 400
+
+
+def test_audit_filters_use_index(server_url: str) -> None:
+    _seed_audit_log(INDEX_EVENTS)
+
+    cases: list[tuple[set[str], bool, set[str]]] = [
+        (set(), False, {"created_at_id"}),
+        (set(), True, {"created_at_id"}),
+        ({"from_time"}, False, {"created_at_id"}),
+        ({"from_time", "to_time"}, False, {"created_at_id"}),
+        ({"action"}, False, {"action_created_at_id"}),
+        ({"topic"}, False, {"topic_created_at_id"}),
+        ({"topic"}, True, {"topic_created_at_id"}),
+        ({"event_id"}, False, {"event_id_topic"}),
+        (
+            {"action", "topic"},
+            False,
+            {"action_created_at_id", "topic_created_at_id"},
+        ),
+        ({"topic", "event_id"}, False, {"event_id_topic", "topic_created_at_id"}),
+    ]
+
+    for filters, has_cursor, indexes in cases:
+        shape = tuple(name in filters for name in AUDIT_FILTER_VALUES)
+        params = [
+            value for name, value in AUDIT_FILTER_VALUES.items() if name in filters
+        ]
+        if has_cursor:
+            params += ["NOW()", "9223372036854775807"]
+        params.append("100")
+
+        plan = execute_sql(
+            "SET plan_cache_mode = force_generic_plan; "
+            f"PREPARE audit_page AS {build_audit_query(shape, has_cursor)}; "
+            f"EXPLAIN EXECUTE audit_page({', '.join(params)})"
+        )
+        assert plan is not None
+
+        used = set(findall(r"audit_log_(?:p\d+|default)_(\w+?)_idx", plan))
+        assert used, plan
+        assert used <= indexes, plan
+        assert "Seq Scan" not in plan
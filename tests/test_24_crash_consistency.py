@@ -0,0 +1,72 @@
+from time import sleep, time
+
+from utils.testing import (
+    execute_sql,
+    generate_test_events,
+    get_stats,
+    kill_aggregator_container,
+    post_request,
+)
+
+
+def wait_for_received_count(
+    server_url: str, expected_count: int, timeout: int = 90
+) -> int:
+    start = time()
+    actual_count = 0
+    while time() - start < timeout:
+        status, stats = get_stats(server_url)
+        if status == 200:
+            actual_count = stats["received"]
+            if actual_count >= expected_count:
+                return actual_count
+        sleep(2)
+    return actual_count
+
+
+def test_stats_consistent_after_worker_kill(server_url: str) -> None:
+    events = generate_test_events(count=10000, duplicate_ratio=0.2, topic="crash")
+
+    for i in range(0, len(events), 1000):
+        status, _ = post_request(
+            f"{server_url}/publish", {"events": events[i : i + 1000]}
+        )
+        assert status == 200
+
+    killed = kill_aggregator_container()
+    assert killed, "Failed to kill and restart aggregator container"
+
+    assert wait_for_received_count(server_url, 10000) >= 10000
+
+    status, stats = get_stats(server_url)
+    assert status == 200
+    assert stats["unique_processed"] == 8000
+    assert stats["received"] >= 10000
+    assert stats["received"] == stats["unique_processed"] + stats["duplicated_dropped"]
+
+
+def test_audit_consistent_after_worker_kill(server_url: str) -> None:
+    status, stats = get_stats(server_url)
+    assert status == 200
+
+    counts = execute_sql(
+        "SELECT "
+        "COUNT(*) FILTER (WHERE action = 'PROCESSED'), "
+        "COUNT(*) FILTER (WHERE action = 'DROPPED'), "
+        "(SELECT COUNT(*) FROM processed_events) "
+        "FROM audit_log"
+    )
+    assert counts is not None
+
+    processed, dropped, stored = (int(value) for value in counts.strip().split("|"))
+    assert processed == stored == stats["unique_processed"]
+    assert dropped == stats["duplicated_dropped"]
+
+    repeated = execute_sql(
+        "SELECT COUNT(*) FROM ("
+        "SELECT topic, event_id FROM audit_log WHERE action = 'PROCESSED' "
+        "GROUP BY topic, event_id HAVING COUNT(*) > 1"
+        ") AS repeated"
+    )
+    assert repeated is not None
+    assert int(repeated) == 0
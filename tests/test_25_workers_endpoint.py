@@ -0,0 +1,15 @@
+from orjson import loads
+from utils.testing import get_request
+
+
+def test_workers_endpoint(server_url: str) -> None:
+    status, response = get_request(f"{server_url}/workers")
+    assert status == 200
+
+    workers = loads(response or "{}")
+    assert workers["min_workers"] <= workers["worker_count"] <= workers["max_workers"]
+    assert workers["backlog"] >= 0
+
+    pool = workers["pool"]
+    assert pool["min_size"] <= pool["max_size"]
+    assert pool["in_use"] + pool["idle"] == pool["size"] <= pool["max_size"]
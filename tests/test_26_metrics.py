@@ -0,0 +1,60 @@
+from time import perf_counter
+
+from src.aggregator.app.metrics import (
+    CONSUMER_EVENTS,
+    INSERT_SECONDS,
+    POOL_ACQUIRE_SECONDS,
+    QUEUE_POP_SECONDS,
+    QUEUE_PUSH_SECONDS,
+)
+from utils.testing import create_events, get_request, publish_events
+
+METRICS_BUDGET_US: float = 10.0
+
+
+def read_metric(server_url: str, name: str, label: str = "") -> float:
+    status, response = get_request(f"{server_url}/metrics")
+    assert status == 200
+    assert response is not None
+
+    return sum(
+        float(line.rsplit(" ", 1)[1])
+        for line in response.splitlines()
+        if line.startswith(name) and label in line
+    )
+
+
+def test_metrics_endpoint(server_url: str) -> None:
+    publish_count = "chronicle_publish_request_seconds_count"
+    consumed = "chronicle_consumer_events_total"
+
+    publish_before = read_metric(server_url, publish_count, '"/publish"')
+    consumed_before = read_metric(server_url, consumed, 'result="processed"')
+
+    events = create_events(count=10, topic="metrics-topic", prefix="metrics-event")
+    publish_events(server_url, events, wait_seconds=3)
+
+    assert read_metric(server_url, publish_count, '"/publish"') == publish_before + 1
+    assert (
+        read_metric(server_url, consumed, 'result="processed"') == consumed_before + 10
+    )
+    assert read_metric(server_url, "chronicle_queue_push_seconds_count") > 0
+    assert read_metric(server_url, "chronicle_insert_batch_seconds_count") > 0
+    assert read_metric(server_url, "chronicle_pool_acquire_seconds_count") > 0
+    assert read_metric(server_url, "chronicle_queue_depth") == 0
+
+
+def test_metrics_overhead_per_event() -> None:
+    iterations = 100000
+
+    start_time = perf_counter()
+    for _ in range(iterations):
+        QUEUE_PUSH_SECONDS.observe(0.001)
+        QUEUE_POP_SECONDS.observe(0.002)
+        POOL_ACQUIRE_SECONDS.observe(0.0001)
+        INSERT_SECONDS.observe(0.004, "any_new")
+        CONSUMER_EVENTS.inc("0", "processed", amount=1)
+        CONSUMER_EVENTS.inc("0", "dropped", amount=0)
+    elapsed_us = (perf_counter() - start_time) / iterations * 1_000_000
+
+    assert elapsed_us < METRICS_BUDGET_US
@@ -0,0 +1,49 @@
+from time import sleep
+
+from orjson import dumps, loads
+from utils.testing import (
+    create_events,
+    get_request,
+    post_ndjson_request,
+    publish_events,
+)
+
+
+def test_latency_stats_per_topic(server_url: str) -> None:
+    events = create_events(count=50, topic="latency-topic", prefix="latency-test")
+    publish_events(server_url, events, wait_seconds=2)
+
+    status, response = get_request(f"{server_url}/stats/latency?topic=latency-topic")
+    assert status == 200
+
+    latency = loads(response or "{}")
+    assert [topic["topic"] for topic in latency["topics"]] == ["latency-topic"]
+
+    topic = latency["topics"][0]
+    assert topic["count"] == 50
+
+    for stage in ("queue_ms", "commit_ms"):
+        percentiles = topic[stage]
+        assert 0 <= percentiles["p50"] <= percentiles["p90"] <= percentiles["p99"]
+
+
+def test_ndjson_client_ingested_at_is_ignored(server_url: str) -> None:
+    events = create_events(count=20, topic="latency-spoof-topic", prefix="spoof")
+    lines = [
+        dumps({**event, "ingested_at": "nope" if i % 2 else "2000-01-01T00:00:00Z"})
+        for i, event in enumerate(events)
+    ]
+
+    status, _ = post_ndjson_request(f"{server_url}/publish/ndjson", lines)
+    assert status == 200
+
+    sleep(3)
+
+    status, response = get_request(
+        f"{server_url}/stats/latency?topic=latency-spoof-topic"
+    )
+    assert status == 200
+
+    topic = loads(response or "{}")["topics"][0]
+    assert topic["count"] == 20
+    assert topic["queue_ms"]["p99"] < 60_000
@@ -0,0 +1,58 @@
+from gzip import compress
+
+from orjson import dumps
+from utils.testing import create_events, get_stats, post_request
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+def _post_chunked(
+    url: str, body: bytes, headers: dict[str, str], chunk_size: int = 65536
+) -> int | None:
+    from http.client import HTTPResponse
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+
+    chunks = (body[i : i + chunk_size] for i in range(0, len(body), chunk_size))
+
+    try:
+        request = Request(url, data=chunks, headers=headers)
+        response: HTTPResponse = urlopen(url=request, timeout=30)
+        with response:
+            return response.getcode()
+    except HTTPError as e:
+        return e.code
+    except Exception:
+        return None
+
+
+def test_publish_rejects_oversized_batch(server_url: str) -> None:
+    _, initial_stats = get_stats(server_url)
+
+    events = create_events(count=10001, topic="admission-topic", prefix="admission")
+    status, _ = post_request(f"{server_url}/publish", {"events": events})
+    assert status == 413
+
+    _, stats = get_stats(server_url)
+    assert stats["received"] == initial_stats["received"]
+
+
+def test_publish_rejects_oversized_chunked_gzip_body(server_url: str) -> None:
+    _, initial_stats = get_stats(server_url)
+
+    events = create_events(count=1, topic="admission-topic", prefix="admission-gzip")
+    events[0]["payload"] = {
+        "message": "x" * (MAX_BODY_BYTES + 65536),
+        "timestamp": "2025-01-01T00:00:00",
+    }
+    body = compress(dumps({"events": events}), compresslevel=0)
+
+    status = _post_chunked(
+        f"{server_url}/publish",
+        body,
+        {"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert status == 413
+
+    _, stats = get_stats(server_url)
+    assert stats["received"] == initial_stats["received"]
@@ -106,7 +106,33 @@ def get_request(url: str, timeout: int = 30) -> tuple[int | None, str | None]:
 
 
 def post_request(
-    url: str, data: dict[str, Any], timeout: int = 30
+    url: str, data: dict[str, Any], timeout: int = 30, use_gzip: bool = False
+) -> tuple[int | None, str | None]:
+    from gzip import compress
+    from http.client import HTTPResponse
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+
+    body: bytes = dumps(data)
+    headers: dict[str, str] = {"Content-Type": "application/json"}
+
+    if use_gzip:
+        body = compress(body)
+        headers["Content-Encoding"] = "gzip"
+
+    try:
+        request = Request(url, data=body, headers=headers)
+        response: HTTPResponse = urlopen(url=request, timeout=timeout)
+        with response:
+            return response.getcode(), response.read().decode("utf-8")
+    except HTTPError as e:
+        return e.code, e.read().decode("utf-8")
+    except Exception:
+        return None, None
+
+
+def post_ndjson_request(
+    url: str, lines: list[bytes], timeout: int = 30
 ) -> tuple[int | None, str | None]:
     from http.client import HTTPResponse
     from urllib.error import HTTPError
@@ -114,7 +140,9 @@ def post_request(
 
     try:
         request = Request(
-            url, data=dumps(data), headers={"Content-Type": "application/json"}
+            url,
+            data=b"\n".join(lines),
+            headers={"Content-Type": "application/x-ndjson"},
         )
         response: HTTPResponse = urlopen(url=request, timeout=timeout)
         with response:
@@ -172,6 +200,19 @@ def restart_aggregator_container(
     return wait_for_server(server_url, max_retries=max_wait)
 
 
+def kill_aggregator_container(
+    compose_dir: str = DEFAULT_COMPOSE_DIR, max_wait: int = 60
+) -> bool:
+    if not _run_compose_command(["kill", "aggregator"], compose_dir, timeout=30):
+        return False
+
+    if not _run_compose_command(["start", "aggregator"], compose_dir, timeout=30):
+        return False
+
+    server_url = environ.get("SERVER_URL", DEFAULT_SERVER_URL)
+    return wait_for_server(server_url, max_retries=max_wait)
+
+
 def reset_environment(
     compose_dir: str = DEFAULT_COMPOSE_DIR, max_wait: int = 120
 ) -> bool:
@@ -211,7 +252,7 @@ def teardown_environment(compose_dir: str = DEFAULT_COMPOSE_DIR) -> bool:
 
 
 def truncate_database(compose_dir: str = DEFAULT_COMPOSE_DIR) -> bool:
-    sql = "TRUNCATE processed_events, audit_log RESTART IDENTITY CASCADE; UPDATE stats SET received = 0, duplicated_dropped = 0, updated_at = NOW() WHERE id = 1;"
+    sql = "TRUNCATE processed_events, audit_log, topics, audit_topic_rollup, audit_worker_rollup RESTART IDENTITY CASCADE; UPDATE stats SET received = 0, unique_processed = 0, duplicated_dropped = 0, updated_at = NOW();"
 
     return _run_compose_command(
         [
@@ -231,6 +272,37 @@ def truncate_database(compose_dir: str = DEFAULT_COMPOSE_DIR) -> bool:
     )
 
 
+def execute_sql(
+    sql: str, compose_dir: str = DEFAULT_COMPOSE_DIR, timeout: int = 10
+) -> str | None:
+    result = run(
+        [
+            "docker",
+            "compose",
+            "exec",
+            "-T",
+            "postgres",
+            "psql",
+            "-U",
+            "chronicle",
+            "-d",
+            "chronicle",
+            "-At",
+            "-v",
+            "ON_ERROR_STOP=1",
+            "-c",
+            sql,
+        ],
+        cwd=_get_compose_path(compose_dir),
+        stdout=PIPE,
+        stderr=PIPE,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode("utf-8")
+
+
 def flush_redis(compose_dir: str = DEFAULT_COMPOSE_DIR) -> bool:
     return _run_compose_command(
         ["exec", "-T", "redis", "redis-cli", "FLUSHDB"],